@@ -1,21 +1,21 @@
-# Yosys Default Synthesis Script
-# This script synthesizes Verilog RTL to gate-level netlist
-
-# Read Verilog files
-# Usage: read_verilog {file1.v} {file2.v} ...
-
-# Set hierarchy
-# hierarchy -check -top {top_module_name}
-
-# Optimization passes
-# proc; opt; fsm; opt; memory; opt
-# techmap; opt
-
-# Technology mapping (if using ABC)
-# abc -script {optimization_script}
-
-# Write output
-# write_json {output_netlist.json}
-
-# Note: This is a template. The actual script is generated
-# dynamically by the synthesizer module based on input files.
+# Yosys Default Synthesis Script
+# This script synthesizes Verilog RTL to gate-level netlist
+
+# Read Verilog files
+# Usage: read_verilog {file1.v} {file2.v} ...
+
+# Set hierarchy
+# hierarchy -check -top {top_module_name}
+
+# Optimization passes
+# proc; opt; fsm; opt; memory; opt
+# techmap; opt
+
+# Technology mapping (if using ABC)
+# abc -script {optimization_script}
+
+# Write output
+# write_json {output_netlist.json}
+
+# Note: This is a template. The actual script is generated
+# dynamically by the synthesizer module based on input files.
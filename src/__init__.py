@@ -1,3 +1,3 @@
-"""Verilog to SPICE conversion package."""
-
-__version__ = "1.0.0"
+"""Verilog to SPICE conversion package."""
+
+__version__ = "1.0.0"
@@ -1,3 +1,3 @@
-"""Verilog to SPICE conversion tool."""
-
-__version__ = "1.0.0"
+"""Verilog to SPICE conversion tool."""
+
+__version__ = "1.0.0"
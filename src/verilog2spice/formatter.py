@@ -1,265 +1,306 @@
-"""SPICE netlist formatter module for hierarchical and flattened output."""
-
-from __future__ import annotations
-
-import logging
-from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
-
-from .mapper import CellLibrary
-from .spice_generator import SpiceNetlist, expand_to_transistor_level
-
-if TYPE_CHECKING:
-    pass
-
-logger = logging.getLogger(__name__)
-
-
-def load_cell_library_content(spice_file: Optional[str]) -> Optional[str]:
-    """Load cell library SPICE file content.
-
-    Args:
-        spice_file: Path to SPICE cell library file
-
-    Returns:
-        Cell library content as string, or None if file not found
-    """
-    if not spice_file:
-        return None
-
-    spice_path = Path(spice_file)
-    if not spice_path.exists():
-        logger.warning(f"SPICE cell library file not found: {spice_file}")
-        return None
-
-    try:
-        content = spice_path.read_text(encoding="utf-8")
-        logger.info(
-            f"Loaded cell library content from: {spice_file} ({len(content)} bytes)"
-        )
-        return content
-    except (OSError, IOError) as e:
-        logger.error(f"Failed to read cell library file '{spice_file}': {e}")
-        return None
-
-
-def format_hierarchical(netlist: SpiceNetlist) -> str:
-    """Format SPICE netlist as hierarchical.
-
-    Args:
-        netlist: SPICE netlist object
-
-    Returns:
-        Formatted hierarchical SPICE netlist string
-    """
-    logger.info("Formatting hierarchical SPICE netlist")
-
-    lines: List[str] = []
-
-    # Add header
-    lines.extend(netlist.header)
-    lines.append("")
-
-    # Add top-level subcircuit
-    if netlist.instances:
-        lines.append("* Top Level Module")
-        lines.append(".SUBCKT TOP")
-        for inst in netlist.instances:
-            lines.append(f"  {inst}")
-        lines.append(".ENDS TOP")
-        lines.append("")
-
-    # Add subcircuits
-    for subcircuit_name, subcircuit_def in netlist.subcircuits.items():
-        lines.append(f"* Subcircuit: {subcircuit_name}")
-        lines.append(subcircuit_def)
-
-    # Add directives (if any - power/ground sources are not added by default)
-    if netlist.directives:
-        lines.extend(netlist.directives)
-
-    return "\n".join(lines)
-
-
-def format_flattened(
-    netlist: SpiceNetlist,
-    cell_library_content: Optional[str] = None,
-    flatten_level: str = "logic",
-    cell_library: Optional[CellLibrary] = None,
-) -> str:
-    """Format SPICE netlist as flattened.
-
-    Args:
-        netlist: SPICE netlist object
-        cell_library_content: Cell library SPICE content (required for flattened output)
-        flatten_level: Flattening level ("logic" or "transistor")
-        cell_library: Cell library (required for transistor-level flattening)
-
-    Returns:
-        Formatted flattened SPICE netlist string
-    """
-    logger.info(f"Formatting flattened SPICE netlist (flatten_level={flatten_level})")
-
-    lines: List[str] = []
-
-    # Add header
-    lines.extend(netlist.header)
-
-    # Handle transistor-level flattening
-    instances_to_output = netlist.instances
-    if flatten_level == "transistor":
-        if not cell_library:
-            raise ValueError("Cell library required for transistor-level flattening")
-        try:
-            instances_to_output = expand_to_transistor_level(
-                instances_to_output, cell_library
-            )
-            # Extract MOSFET model definitions from cell library
-            from .spice_parser import extract_model_definitions
-
-            if cell_library_content:
-                models = extract_model_definitions(cell_library_content)
-                if models:
-                    lines.append("")
-                    lines.append(
-                        "* ============================================================================"
-                    )
-                    lines.append("* MOSFET Model Definitions")
-                    lines.append(
-                        "* ============================================================================"
-                    )
-                    lines.append("")
-                    for model_line in models.values():
-                        lines.append(model_line)
-                    lines.append("")
-        except (ValueError, KeyError, FileNotFoundError) as e:
-            logger.error(f"Failed to expand to transistor level: {e}")
-            raise
-    elif cell_library_content:
-        # Logic-level: embed cell library subcircuit definitions
-        lines.append("")
-        lines.append(
-            "* ============================================================================"
-        )
-        lines.append("* Embedded Cell Library Models")
-        lines.append(
-            "* ============================================================================"
-        )
-        lines.append("")
-        lines.append(cell_library_content)
-        lines.append("")
-
-    # Add section header for instances
-    lines.append(
-        "* ============================================================================"
-    )
-    if flatten_level == "transistor":
-        lines.append("* Transistor-Level Circuit Instances")
-    else:
-        lines.append("* Circuit Instances (Logic-Level)")
-    lines.append(
-        "* ============================================================================"
-    )
-    lines.append("")
-
-    # Flatten hierarchy
-    flattened_netlist = flatten_hierarchy(netlist)
-
-    # Add all instances at top level
-    if instances_to_output:
-        for inst in instances_to_output:
-            lines.append(inst)
-        lines.append("")
-
-    # Add directives (if any - power/ground sources are not added by default)
-    if flattened_netlist.directives:
-        lines.extend(flattened_netlist.directives)
-
-    return "\n".join(lines)
-
-
-def flatten_hierarchy(netlist: SpiceNetlist) -> SpiceNetlist:
-    """Flatten hierarchical netlist structure.
-
-    Args:
-        netlist: Hierarchical SPICE netlist
-
-    Returns:
-        Flattened SPICE netlist
-
-    Note:
-        This is a simplified implementation. A full version would
-        recursively expand subcircuits and rename instances.
-    """
-    logger.debug("Flattening netlist hierarchy")
-
-    # For now, just return the netlist as-is
-    # In a full implementation, we would:
-    # 1. Extract all instances from subcircuits
-    # 2. Rename instances with hierarchical paths (e.g., top.sub1.gate1)
-    # 3. Resolve port connections
-    # 4. Remove subcircuit definitions
-
-    return netlist
-
-
-def add_comments(netlist_text: str, metadata: Dict[str, str]) -> str:
-    """Add metadata comments to netlist.
-
-    Args:
-        netlist_text: SPICE netlist text
-        metadata: Dictionary of metadata to add as comments
-
-    Returns:
-        Netlist text with added comments
-    """
-    lines = netlist_text.split("\n")
-
-    # Add metadata at the beginning
-    comment_lines = ["* Metadata:"]
-    for key, value in metadata.items():
-        comment_lines.append(f"*   {key}: {value}")
-    comment_lines.append("")
-
-    return "\n".join(comment_lines + lines)
-
-
-def validate_spice(netlist_text: str) -> bool:
-    """Validate SPICE netlist syntax.
-
-    Args:
-        netlist_text: SPICE netlist text
-
-    Returns:
-        True if valid, False otherwise
-
-    Note:
-        This is a basic validation. A full implementation would
-        use a SPICE parser or simulator for validation.
-    """
-    logger.debug("Validating SPICE syntax")
-
-    # Basic checks
-    if not netlist_text.strip():
-        logger.warning("Empty netlist")
-        return False
-
-    # Check for basic SPICE statements
-    lines = netlist_text.split("\n")
-    has_subcircuit = False
-    has_instance = False
-
-    for line in lines:
-        line_upper = line.strip().upper()
-        if line_upper.startswith(".SUBCKT"):
-            has_subcircuit = True
-        if line_upper.startswith("X") or line_upper.startswith("M"):
-            has_instance = True
-
-    # Basic validation passed
-    if has_subcircuit or has_instance:
-        logger.debug("SPICE syntax validation passed")
-        return True
-
-    logger.warning("SPICE netlist appears to be empty or invalid")
-    return False
+"""SPICE netlist formatter module for hierarchical and flattened output."""
+
+from __future__ import annotations
+
+import io
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, TextIO
+
+from .mapper import CellLibrary
+from .spice_generator import SpiceNetlist, expand_to_transistor_level
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+
+def load_cell_library_content(spice_file: Optional[str]) -> Optional[str]:
+    """Load cell library SPICE file content.
+
+    Args:
+        spice_file: Path to SPICE cell library file
+
+    Returns:
+        Cell library content as string, or None if file not found
+    """
+    if not spice_file:
+        return None
+
+    spice_path = Path(spice_file)
+    if not spice_path.exists():
+        logger.warning(f"SPICE cell library file not found: {spice_file}")
+        return None
+
+    try:
+        content = spice_path.read_text(encoding="utf-8")
+        logger.info(
+            f"Loaded cell library content from: {spice_file} ({len(content)} bytes)"
+        )
+        return content
+    except (OSError, IOError) as e:
+        logger.error(f"Failed to read cell library file '{spice_file}': {e}")
+        return None
+
+
+def write_hierarchical(netlist: SpiceNetlist, out: TextIO) -> None:
+    """Write hierarchical SPICE netlist to a text stream.
+
+    Lines go straight to the (buffered) stream, so large netlists are
+    never accumulated in an intermediate list before writing.
+
+    Args:
+        netlist: SPICE netlist object
+        out: Writable text stream
+    """
+    logger.info("Formatting hierarchical SPICE netlist")
+
+    # Write header
+    for line in netlist.header:
+        out.write(line)
+        out.write("\n")
+    out.write("\n")
+
+    # Write top-level subcircuit
+    if netlist.instances:
+        out.write("* Top Level Module\n")
+        out.write(".SUBCKT TOP\n")
+        for inst in netlist.instances:
+            out.write(f"  {inst}\n")
+        out.write(".ENDS TOP\n")
+        out.write("\n")
+
+    # Write subcircuits
+    for subcircuit_name, subcircuit_def in netlist.subcircuits.items():
+        out.write(f"* Subcircuit: {subcircuit_name}\n")
+        out.write(subcircuit_def)
+        out.write("\n")
+
+    # Write directives (if any - power/ground sources are not added by default)
+    for directive in netlist.directives:
+        out.write(directive)
+        out.write("\n")
+
+
+def format_hierarchical(netlist: SpiceNetlist) -> str:
+    """Format SPICE netlist as hierarchical.
+
+    Args:
+        netlist: SPICE netlist object
+
+    Returns:
+        Formatted hierarchical SPICE netlist string
+    """
+    buf = io.StringIO()
+    write_hierarchical(netlist, buf)
+    # The string form historically has no trailing newline
+    return buf.getvalue().removesuffix("\n")
+
+
+def write_flattened(
+    netlist: SpiceNetlist,
+    out: TextIO,
+    cell_library_content: Optional[str] = None,
+    flatten_level: str = "logic",
+    cell_library: Optional[CellLibrary] = None,
+) -> None:
+    """Write flattened SPICE netlist to a text stream.
+
+    Lines go straight to the (buffered) stream, so the expanded netlist is
+    never accumulated in an intermediate list before writing.
+
+    Args:
+        netlist: SPICE netlist object
+        out: Writable text stream
+        cell_library_content: Cell library SPICE content (required for flattened output)
+        flatten_level: Flattening level ("logic" or "transistor")
+        cell_library: Cell library (required for transistor-level flattening)
+    """
+    logger.info(f"Formatting flattened SPICE netlist (flatten_level={flatten_level})")
+
+    section_rule = (
+        "* ============================================================================\n"
+    )
+
+    # Write header
+    for line in netlist.header:
+        out.write(line)
+        out.write("\n")
+
+    # Handle transistor-level flattening
+    instances_to_output = netlist.instances
+    if flatten_level == "transistor":
+        if not cell_library:
+            raise ValueError("Cell library required for transistor-level flattening")
+        try:
+            instances_to_output = expand_to_transistor_level(
+                instances_to_output, cell_library
+            )
+            # Extract MOSFET model definitions from cell library
+            from .spice_parser import extract_model_definitions
+
+            if cell_library_content:
+                models = extract_model_definitions(cell_library_content)
+                if models:
+                    out.write("\n")
+                    out.write(section_rule)
+                    out.write("* MOSFET Model Definitions\n")
+                    out.write(section_rule)
+                    out.write("\n")
+                    for model_line in models.values():
+                        out.write(model_line)
+                        out.write("\n")
+                    out.write("\n")
+        except (ValueError, KeyError, FileNotFoundError) as e:
+            logger.error(f"Failed to expand to transistor level: {e}")
+            raise
+    elif cell_library_content:
+        # Logic-level: embed cell library subcircuit definitions
+        out.write("\n")
+        out.write(section_rule)
+        out.write("* Embedded Cell Library Models\n")
+        out.write(section_rule)
+        out.write("\n")
+        out.write(cell_library_content)
+        out.write("\n\n")
+
+    # Write section header for instances
+    out.write(section_rule)
+    if flatten_level == "transistor":
+        out.write("* Transistor-Level Circuit Instances\n")
+    else:
+        out.write("* Circuit Instances (Logic-Level)\n")
+    out.write(section_rule)
+    out.write("\n")
+
+    # Flatten hierarchy
+    flattened_netlist = flatten_hierarchy(netlist)
+
+    # Write all instances at top level
+    if instances_to_output:
+        for inst in instances_to_output:
+            out.write(inst)
+            out.write("\n")
+        out.write("\n")
+
+    # Write directives (if any - power/ground sources are not added by default)
+    for directive in flattened_netlist.directives:
+        out.write(directive)
+        out.write("\n")
+
+
+def format_flattened(
+    netlist: SpiceNetlist,
+    cell_library_content: Optional[str] = None,
+    flatten_level: str = "logic",
+    cell_library: Optional[CellLibrary] = None,
+) -> str:
+    """Format SPICE netlist as flattened.
+
+    Args:
+        netlist: SPICE netlist object
+        cell_library_content: Cell library SPICE content (required for flattened output)
+        flatten_level: Flattening level ("logic" or "transistor")
+        cell_library: Cell library (required for transistor-level flattening)
+
+    Returns:
+        Formatted flattened SPICE netlist string
+    """
+    buf = io.StringIO()
+    write_flattened(
+        netlist,
+        buf,
+        cell_library_content=cell_library_content,
+        flatten_level=flatten_level,
+        cell_library=cell_library,
+    )
+    # The string form historically has no trailing newline
+    return buf.getvalue().removesuffix("\n")
+
+
+def flatten_hierarchy(netlist: SpiceNetlist) -> SpiceNetlist:
+    """Flatten hierarchical netlist structure.
+
+    Args:
+        netlist: Hierarchical SPICE netlist
+
+    Returns:
+        Flattened SPICE netlist
+
+    Note:
+        This is a simplified implementation. A full version would
+        recursively expand subcircuits and rename instances.
+    """
+    logger.debug("Flattening netlist hierarchy")
+
+    # For now, just return the netlist as-is
+    # In a full implementation, we would:
+    # 1. Extract all instances from subcircuits
+    # 2. Rename instances with hierarchical paths (e.g., top.sub1.gate1)
+    # 3. Resolve port connections
+    # 4. Remove subcircuit definitions
+
+    return netlist
+
+
+def add_comments(netlist_text: str, metadata: Dict[str, str]) -> str:
+    """Add metadata comments to netlist.
+
+    Args:
+        netlist_text: SPICE netlist text
+        metadata: Dictionary of metadata to add as comments
+
+    Returns:
+        Netlist text with added comments
+    """
+    lines = netlist_text.split("\n")
+
+    # Add metadata at the beginning
+    comment_lines = ["* Metadata:"]
+    for key, value in metadata.items():
+        comment_lines.append(f"*   {key}: {value}")
+    comment_lines.append("")
+
+    return "\n".join(comment_lines + lines)
+
+
+def validate_spice(netlist_text: str) -> bool:
+    """Validate SPICE netlist syntax.
+
+    Args:
+        netlist_text: SPICE netlist text
+
+    Returns:
+        True if valid, False otherwise
+
+    Note:
+        This is a basic validation. A full implementation would
+        use a SPICE parser or simulator for validation.
+    """
+    logger.debug("Validating SPICE syntax")
+
+    # Basic checks
+    if not netlist_text.strip():
+        logger.warning("Empty netlist")
+        return False
+
+    # Check for basic SPICE statements
+    lines = netlist_text.split("\n")
+    has_subcircuit = False
+    has_instance = False
+
+    for line in lines:
+        line_upper = line.strip().upper()
+        if line_upper.startswith(".SUBCKT"):
+            has_subcircuit = True
+        if line_upper.startswith("X") or line_upper.startswith("M"):
+            has_instance = True
+
+    # Basic validation passed
+    if has_subcircuit or has_instance:
+        logger.debug("SPICE syntax validation passed")
+        return True
+
+    logger.warning("SPICE netlist appears to be empty or invalid")
+    return False
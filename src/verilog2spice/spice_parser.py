@@ -1,212 +1,323 @@
-"""SPICE subcircuit parser for extracting transistor-level definitions."""
-
-from __future__ import annotations
-
-import logging
-import re
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
-
-if TYPE_CHECKING:
-    pass
-
-logger = logging.getLogger(__name__)
-
-
-class SubcircuitDefinition:
-    """SPICE subcircuit definition.
-
-    Attributes:
-        name: Subcircuit name
-        ports: List of port names in order
-        instances: List of instance statements (transistors or subcircuit calls)
-        lines: Raw lines of the subcircuit definition
-    """
-
-    def __init__(
-        self,
-        name: str,
-        ports: List[str],
-        instances: List[str],
-        lines: List[str],
-    ) -> None:
-        """Initialize SubcircuitDefinition.
-
-        Args:
-            name: Subcircuit name
-            ports: List of port names
-            instances: List of instance statements
-            lines: Raw lines of the subcircuit
-        """
-        self.name = name
-        self.ports = ports
-        self.instances = instances
-        self.lines = lines
-
-    def __repr__(self) -> str:
-        """String representation."""
-        return f"SubcircuitDefinition(name={self.name}, ports={self.ports}, instances={len(self.instances)})"
-
-
-def parse_subcircuit_line(line: str) -> Optional[Tuple[str, List[str]]]:
-    """Parse a .SUBCKT line to extract name and ports.
-
-    Args:
-        line: SPICE .SUBCKT line
-
-    Returns:
-        Tuple of (name, ports) or None if not a valid .SUBCKT line
-    """
-    line = line.strip()
-    if not line.upper().startswith(".SUBCKT"):
-        return None
-
-    # Remove .SUBCKT keyword
-    rest = line[7:].strip()
-    if not rest:
-        return None
-
-    # Split by whitespace
-    parts = rest.split()
-    if not parts:
-        return None
-
-    name = parts[0]
-    ports = parts[1:] if len(parts) > 1 else []
-
-    return (name, ports)
-
-
-def is_instance_line(line: str) -> bool:
-    """Check if a line is a SPICE instance statement.
-
-    Args:
-        line: Line to check
-
-    Returns:
-        True if the line is an instance statement (transistor or subcircuit call)
-    """
-    line = line.strip()
-    if not line:
-        return False
-
-    # Instance lines start with M (transistor) or X (subcircuit call)
-    # They can also have a + continuation marker
-    first_char = line[0].upper()
-    return first_char in ("M", "X") or line.startswith("+") or line.startswith("*")
-
-
-def parse_spice_subcircuits(spice_content: str) -> Dict[str, SubcircuitDefinition]:
-    """Parse SPICE content to extract all subcircuit definitions.
-
-    Args:
-        spice_content: SPICE file content as string
-
-    Returns:
-        Dictionary mapping subcircuit names to SubcircuitDefinition objects
-    """
-    subcircuits: Dict[str, SubcircuitDefinition] = {}
-    lines = spice_content.split("\n")
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Check for .SUBCKT
-        subcircuit_info = parse_subcircuit_line(line)
-        if subcircuit_info:
-            name, ports = subcircuit_info
-
-            # Collect subcircuit body until .ENDS
-            subcircuit_lines = [line]
-            instance_lines: List[str] = []
-            i += 1
-
-            while i < len(lines):
-                current_line = lines[i]
-                subcircuit_lines.append(current_line)
-
-                # Check for .ENDS
-                if current_line.strip().upper().startswith(".ENDS"):
-                    # Check if .ENDS has a name (should match subcircuit name)
-                    ends_rest = current_line[5:].strip()
-                    if ends_rest and ends_rest != name:
-                        logger.warning(
-                            f"Subcircuit {name} ends with different name: {ends_rest}"
-                        )
-                    break
-
-                # Check for instance statements
-                if is_instance_line(current_line):
-                    instance_lines.append(current_line.strip())
-
-                i += 1
-
-            # Create subcircuit definition
-            subcircuits[name] = SubcircuitDefinition(
-                name=name,
-                ports=ports,
-                instances=instance_lines,
-                lines=subcircuit_lines,
-            )
-
-            logger.debug(
-                f"Parsed subcircuit: {name} with {len(instance_lines)} instances"
-            )
-
-        i += 1
-
-    logger.info(f"Parsed {len(subcircuits)} subcircuits from SPICE content")
-    return subcircuits
-
-
-def extract_model_definitions(spice_content: str) -> Dict[str, str]:
-    """Extract MOSFET model definitions from SPICE content.
-
-    Args:
-        spice_content: SPICE file content
-
-    Returns:
-        Dictionary mapping model names (NMOS, PMOS) to their .model line
-    """
-    models: Dict[str, str] = {}
-    lines = spice_content.split("\n")
-
-    for line in lines:
-        line_stripped = line.strip()
-        if line_stripped.upper().startswith(".MODEL"):
-            # Parse model line: .MODEL name type (params...)
-            match = re.match(r"\.model\s+(\w+)\s+(\w+)", line_stripped, re.IGNORECASE)
-            if match:
-                model_name = match.group(1)
-                model_type = match.group(2)
-                models[model_name] = line_stripped
-                logger.debug(f"Found model: {model_name} ({model_type})")
-
-    return models
-
-
-def load_subcircuit_definitions(
-    spice_file: Optional[str],
-) -> Dict[str, SubcircuitDefinition]:
-    """Load subcircuit definitions from SPICE file.
-
-    Args:
-        spice_file: Path to SPICE file
-
-    Returns:
-        Dictionary mapping subcircuit names to definitions
-
-    Raises:
-        FileNotFoundError: If file not found
-    """
-    if not spice_file:
-        return {}
-
-    from pathlib import Path
-
-    spice_path = Path(spice_file)
-    if not spice_path.exists():
-        raise FileNotFoundError(f"SPICE file not found: {spice_file}")
-
-    content = spice_path.read_text(encoding="utf-8")
-    return parse_spice_subcircuits(content)
+"""SPICE subcircuit parser for extracting transistor-level definitions."""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+# Segments .SUBCKT ... .ENDS blocks in one C-speed scan: group 1 is the
+# .SUBCKT line, group 2 the body, group 3 the .ENDS line.
+_SUBCKT_BLOCK_RE = re.compile(
+    r"^[ \t]*(\.SUBCKT[^\n]*)\n(.*?)^[ \t]*(\.ENDS[^\n]*)",
+    re.DOTALL | re.MULTILINE | re.IGNORECASE,
+)
+
+# Opening .SUBCKT line alone, for the unterminated-tail fallback below.
+_SUBCKT_OPEN_RE = re.compile(
+    r"^[ \t]*(\.SUBCKT[^\n]*)",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# In-process cache of loaded definition stores, keyed by the source
+# file's resolved path, mtime, and size. There is deliberately no disk
+# layer: since parsing went lazy (LazySubcircuitStore), a fresh load only
+# pays a read plus the regex index scan, which a pickle of the full
+# content cannot beat.
+_DEFINITIONS_CACHE: Dict[Tuple[str, int, int], Mapping[str, "SubcircuitDefinition"]] = {}
+_DEFINITIONS_CACHE_MAX = 8
+
+
+@dataclass(slots=True)
+class SubcircuitDefinition:
+    """SPICE subcircuit definition.
+
+    Attributes:
+        name: Subcircuit name
+        ports: List of port names in order
+        instances: List of instance statements (transistors or subcircuit calls)
+        lines: Raw lines of the subcircuit definition
+        parsed_instances: Lazily-populated parsed form of `instances`,
+            filled in on first expansion so repeated expansions of the
+            same cell type never re-tokenize the body
+        emit_plan: Lazily-compiled emission plan derived from
+            `parsed_instances` by the expander
+        port_index: Lazily-built port name -> position map used when
+            compiling the emission plan
+    """
+
+    name: str
+    ports: List[str]
+    instances: List[str]
+    lines: List[str]
+    parsed_instances: Optional[
+        Tuple[Tuple[str, List[str], str, List[str]], ...]
+    ] = field(default=None)
+    emit_plan: Optional[Tuple[Tuple, ...]] = field(default=None)
+    port_index: Optional[Dict[str, int]] = field(default=None)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"SubcircuitDefinition(name={self.name}, ports={self.ports}, instances={len(self.instances)})"
+
+
+def parse_subcircuit_line(line: str) -> Optional[Tuple[str, List[str]]]:
+    """Parse a .SUBCKT line to extract name and ports.
+
+    Args:
+        line: SPICE .SUBCKT line
+
+    Returns:
+        Tuple of (name, ports) or None if not a valid .SUBCKT line
+    """
+    line = line.lstrip()
+    # Only uppercase the 7-char prefix rather than the whole line
+    if line[:7].upper() != ".SUBCKT":
+        return None
+
+    # Remove .SUBCKT keyword
+    rest = line[7:].strip()
+    if not rest:
+        return None
+
+    # Split by whitespace
+    parts = rest.split()
+    if not parts:
+        return None
+
+    name = parts[0]
+    ports = parts[1:] if len(parts) > 1 else []
+
+    return (name, ports)
+
+
+def is_instance_line(line: str) -> bool:
+    """Check if a line is a SPICE instance statement.
+
+    Args:
+        line: Line to check
+
+    Returns:
+        True if the line is an instance statement (transistor or subcircuit call)
+    """
+    # Instance lines start with M (transistor) or X (subcircuit call)
+    # They can also have a + continuation marker
+    s = line.lstrip()
+    return bool(s) and s[0] in "MXmx+*"
+
+
+def parse_spice_subcircuits(spice_content: str) -> Dict[str, SubcircuitDefinition]:
+    """Parse SPICE content to extract all subcircuit definitions.
+
+    Args:
+        spice_content: SPICE file content as string
+
+    Returns:
+        Dictionary mapping subcircuit names to SubcircuitDefinition objects
+    """
+    subcircuits: Dict[str, SubcircuitDefinition] = {}
+    last_end = 0
+
+    for match in _SUBCKT_BLOCK_RE.finditer(spice_content):
+        last_end = match.end()
+        subcircuit_info = parse_subcircuit_line(match.group(1))
+        if not subcircuit_info:
+            continue
+        name, ports = subcircuit_info
+
+        # Check if .ENDS has a name (should match subcircuit name)
+        ends_rest = match.group(3)[5:].strip()
+        if ends_rest and ends_rest != name:
+            logger.warning(
+                f"Subcircuit {name} ends with different name: {ends_rest}"
+            )
+
+        # Collect instance statements (transistors, subcircuit calls,
+        # continuations, and comments - filtered downstream)
+        instance_lines: List[str] = []
+        for body_line in match.group(2).splitlines():
+            body_stripped = body_line.strip()
+            if body_stripped and body_stripped[0] in "MXmx+*":
+                instance_lines.append(body_stripped)
+
+        subcircuits[name] = SubcircuitDefinition(
+            name=name,
+            ports=ports,
+            instances=instance_lines,
+            lines=match.group(0).splitlines(),
+        )
+
+        logger.debug(
+            f"Parsed subcircuit: {name} with {len(instance_lines)} instances"
+        )
+
+    # Fallback for a trailing subcircuit truncated before its .ENDS: the
+    # old line scanner still produced a usable definition at EOF, so a
+    # final open .SUBCKT is parsed through to the end of the content.
+    tail_match = _SUBCKT_OPEN_RE.search(spice_content, last_end)
+    if tail_match:
+        subcircuit_info = parse_subcircuit_line(tail_match.group(1))
+        if subcircuit_info:
+            name, ports = subcircuit_info
+            block_lines = spice_content[tail_match.start():].splitlines()
+
+            instance_lines = []
+            for body_line in block_lines[1:]:
+                body_stripped = body_line.strip()
+                if body_stripped and body_stripped[0] in "MXmx+*":
+                    instance_lines.append(body_stripped)
+
+            subcircuits[name] = SubcircuitDefinition(
+                name=name,
+                ports=ports,
+                instances=instance_lines,
+                lines=block_lines,
+            )
+
+            logger.warning(
+                f"Subcircuit {name} has no .ENDS; parsed through end of content"
+            )
+
+    logger.info(f"Parsed {len(subcircuits)} subcircuits from SPICE content")
+    return subcircuits
+
+
+class LazySubcircuitStore(Mapping[str, "SubcircuitDefinition"]):
+    """Mapping that parses subcircuit definitions on first access.
+
+    Only an index of name -> block span is built eagerly; a subcircuit's
+    body is parsed the first time it is dereferenced and cached. Designs
+    that instantiate a handful of a PDK's thousands of cells never pay to
+    parse the rest.
+    """
+
+    def __init__(self, content: str) -> None:
+        """Initialize the store by indexing .SUBCKT block spans.
+
+        Args:
+            content: Full SPICE file content
+        """
+        self._content = content
+        self._spans: Dict[str, Tuple[int, int]] = {}
+        self._parsed: Dict[str, SubcircuitDefinition] = {}
+        last_end = 0
+        for match in _SUBCKT_BLOCK_RE.finditer(content):
+            last_end = match.end()
+            info = parse_subcircuit_line(match.group(1))
+            if info:
+                self._spans[info[0]] = (match.start(), match.end())
+        # A trailing subcircuit without .ENDS spans to end of content
+        tail_match = _SUBCKT_OPEN_RE.search(content, last_end)
+        if tail_match:
+            info = parse_subcircuit_line(tail_match.group(1))
+            if info:
+                self._spans[info[0]] = (tail_match.start(), len(content))
+        logger.info(f"Indexed {len(self._spans)} subcircuits from SPICE content")
+
+    def __contains__(self, name: object) -> bool:
+        """Check if a subcircuit name exists without parsing it."""
+        return name in self._spans
+
+    def __len__(self) -> int:
+        """Number of indexed subcircuits."""
+        return len(self._spans)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate indexed subcircuit names."""
+        return iter(self._spans)
+
+    def __getitem__(self, name: str) -> SubcircuitDefinition:
+        """Get a subcircuit definition, parsing its block on first access.
+
+        Args:
+            name: Subcircuit name
+
+        Returns:
+            Parsed SubcircuitDefinition
+
+        Raises:
+            KeyError: If the name is not in the index
+        """
+        subcircuit = self._parsed.get(name)
+        if subcircuit is None:
+            start, end = self._spans[name]
+            subcircuit = parse_spice_subcircuits(self._content[start:end])[name]
+            self._parsed[name] = subcircuit
+        return subcircuit
+
+
+def extract_model_definitions(spice_content: str) -> Dict[str, str]:
+    """Extract MOSFET model definitions from SPICE content.
+
+    Args:
+        spice_content: SPICE file content
+
+    Returns:
+        Dictionary mapping model names (NMOS, PMOS) to their .model line
+    """
+    models: Dict[str, str] = {}
+    lines = spice_content.split("\n")
+
+    for line in lines:
+        line_stripped = line.strip()
+        if line_stripped.upper().startswith(".MODEL"):
+            # Parse model line: .MODEL name type (params...)
+            match = re.match(r"\.model\s+(\w+)\s+(\w+)", line_stripped, re.IGNORECASE)
+            if match:
+                model_name = match.group(1)
+                model_type = match.group(2)
+                models[model_name] = line_stripped
+                logger.debug(f"Found model: {model_name} ({model_type})")
+
+    return models
+
+
+def load_subcircuit_definitions(
+    spice_file: Optional[str],
+) -> Mapping[str, SubcircuitDefinition]:
+    """Load subcircuit definitions from SPICE file.
+
+    Definitions are indexed eagerly but parsed lazily on first access (see
+    LazySubcircuitStore). Results are cached in-process keyed by the
+    file's path, mtime, and size, so per-module flows re-scan the cell
+    library only when it actually changes.
+
+    Args:
+        spice_file: Path to SPICE file
+
+    Returns:
+        Dictionary mapping subcircuit names to definitions
+
+    Raises:
+        FileNotFoundError: If file not found
+    """
+    if not spice_file:
+        return {}
+
+    spice_path = Path(spice_file)
+    if not spice_path.exists():
+        raise FileNotFoundError(f"SPICE file not found: {spice_file}")
+
+    stat = spice_path.stat()
+    key = (str(spice_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    cached = _DEFINITIONS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # SPICE content is ASCII; latin-1 decodes byte-for-byte at memcpy
+    # speed with no UTF-8 validation pass over multi-MB PDK files.
+    content = spice_path.read_bytes().decode("latin-1")
+    subcircuits = LazySubcircuitStore(content)
+
+    if len(_DEFINITIONS_CACHE) >= _DEFINITIONS_CACHE_MAX:
+        _DEFINITIONS_CACHE.clear()
+    _DEFINITIONS_CACHE[key] = subcircuits
+    return subcircuits
@@ -1,279 +1,1274 @@
-"""Synthesis module for converting RTL to gate-level netlist using Yosys."""
-
-from __future__ import annotations
-
-import json
-import logging
-import subprocess  # nosec B404
-import tempfile
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-
-if TYPE_CHECKING:
-    pass
-
-logger = logging.getLogger(__name__)
-
-
-class Netlist:
-    """Gate-level netlist representation.
-
-    Attributes:
-        modules: Dictionary of modules in the netlist
-        top_module: Name of the top-level module
-        json_data: Raw Yosys JSON data
-    """
-
-    def __init__(
-        self,
-        modules: Optional[Dict[str, Any]] = None,
-        top_module: Optional[str] = None,
-        json_data: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Initialize Netlist.
-
-        Args:
-            modules: Dictionary of modules
-            top_module: Top-level module name
-            json_data: Raw Yosys JSON data
-        """
-        self.modules = modules or {}
-        self.top_module = top_module
-        self.json_data = json_data or {}
-
-
-def check_yosys() -> bool:
-    """Check if Yosys is available.
-
-    Returns:
-        True if Yosys is available, False otherwise
-    """
-    try:
-        result = subprocess.run(  # nosec B603, B607
-            ["yosys", "-V"],
-            capture_output=True,
-            check=False,
-            timeout=5,
-        )
-        return result.returncode == 0
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False
-
-
-def synthesize(
-    verilog_files: List[str],
-    top_module: str,
-    script: Optional[str] = None,
-    optimize: bool = True,
-    output_dir: Optional[str] = None,
-    include_paths: Optional[List[str]] = None,
-    defines: Optional[Dict[str, str]] = None,
-) -> Netlist:
-    """Synthesize Verilog RTL to gate-level netlist using Yosys.
-
-    Args:
-        verilog_files: List of Verilog file paths
-        top_module: Top-level module name
-        script: Optional custom Yosys synthesis script path
-        optimize: Whether to enable optimization
-        output_dir: Optional output directory for temporary files
-        include_paths: Optional list of include paths
-        defines: Optional dictionary of preprocessor defines
-
-    Returns:
-        Netlist object containing gate-level representation
-
-    Raises:
-        RuntimeError: If synthesis fails or Yosys is not available
-    """
-    logger.info(f"Synthesizing design with top module: {top_module}")
-
-    # Check if Yosys is available
-    if not check_yosys():
-        raise RuntimeError(
-            "Yosys is required but not found. "
-            "Please install Yosys: sudo apt-get install yosys (Linux) or brew install yosys (macOS)"
-        )
-
-    # Use custom script or default
-    if script and Path(script).exists():
-        script_path = script
-        logger.info(f"Using custom synthesis script: {script_path}")
-        # Extract output path from script or use default
-        if output_dir:
-            netlist_path = Path(output_dir) / "netlist.json"
-        else:
-            netlist_path = Path(tempfile.gettempdir()) / "netlist.json"
-    else:
-        script_path, netlist_path = create_default_synthesis_script(
-            verilog_files,
-            top_module,
-            optimize,
-            output_dir,
-            include_paths,
-            defines,
-        )
-
-    # Run Yosys
-    try:
-        run_yosys(script_path)
-
-        # Read and parse JSON output
-        if not netlist_path.exists():
-            raise RuntimeError(f"Yosys JSON output file not found: {netlist_path}")
-
-        with open(netlist_path, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
-
-        netlist = parse_yosys_json(json_data, top_module)
-        logger.info("Synthesis completed successfully")
-        return netlist
-
-    except (
-        subprocess.TimeoutExpired,
-        subprocess.CalledProcessError,
-        FileNotFoundError,
-        json.JSONDecodeError,
-        OSError,
-    ) as e:
-        logger.error(f"Synthesis failed: {e}")
-        raise RuntimeError(f"Synthesis failed: {e}") from e
-
-
-def create_default_synthesis_script(
-    verilog_files: List[str],
-    top_module: str,
-    optimize: bool,
-    output_dir: Optional[str],
-    include_paths: Optional[List[str]] = None,
-    defines: Optional[Dict[str, str]] = None,
-) -> tuple[str, Path]:
-    """Create a default Yosys synthesis script.
-
-    Args:
-        verilog_files: List of Verilog file paths
-        top_module: Top-level module name
-        optimize: Whether to enable optimization
-        output_dir: Optional output directory
-        include_paths: Optional list of include paths
-        defines: Optional dictionary of preprocessor defines
-
-    Returns:
-        Tuple of (script_path, netlist_json_path)
-    """
-    if output_dir:
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-    else:
-        output_path = Path(tempfile.gettempdir())
-
-    script_path = output_path / "synthesis.ys"
-    netlist_path = output_path / "netlist.json"
-
-    # Build read_verilog command with includes and defines
-    read_cmd_parts = ["read_verilog"]
-
-    # Add include paths
-    if include_paths:
-        for inc_path in include_paths:
-            read_cmd_parts.append(f"-I{inc_path}")
-
-    # Add defines
-    if defines:
-        for name, value in defines.items():
-            read_cmd_parts.append(f"-D{name}={value}")
-
-    # Add Verilog files
-    read_cmd_parts.extend(verilog_files)
-    read_cmd = " ".join(read_cmd_parts)
-
-    # Build optimization commands
-    opt_cmds = ""
-    if optimize:
-        opt_cmds = """
-proc; opt; fsm; opt; memory; opt
-techmap; opt
-"""
-
-    script_content = f"""# Yosys synthesis script
-{read_cmd}
-hierarchy -check -top {top_module}
-flatten
-{opt_cmds}
-write_json "{netlist_path}"
-"""
-
-    script_path.write_text(script_content)
-    logger.debug(f"Created synthesis script: {script_path}")
-
-    return str(script_path), netlist_path
-
-
-def run_yosys(script_path: str) -> None:
-    """Run Yosys with the given script.
-
-    Args:
-        script_path: Path to Yosys script
-
-    Raises:
-        RuntimeError: If Yosys execution fails
-    """
-    logger.debug(f"Running Yosys with script: {script_path}")
-
-    try:
-        result = subprocess.run(  # nosec B603, B607
-            ["yosys", "-s", script_path],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=300,  # 5 minute timeout
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError(f"Yosys failed: {result.stderr}")
-
-        logger.debug("Yosys execution completed")
-        if result.stderr:
-            logger.debug(f"Yosys warnings: {result.stderr}")
-
-    except subprocess.TimeoutExpired:
-        raise RuntimeError("Yosys execution timed out")
-    except FileNotFoundError:
-        raise RuntimeError("Yosys not found in PATH")
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Yosys execution failed: {e.stderr}")
-
-
-def parse_yosys_json(json_data: Dict[str, Any], top_module: str) -> Netlist:
-    """Parse Yosys JSON output into Netlist object.
-
-    Args:
-        json_data: Yosys JSON data structure
-        top_module: Top-level module name
-
-    Returns:
-        Netlist object
-    """
-    logger.debug("Parsing Yosys JSON output")
-
-    modules = json_data.get("modules", {})
-
-    # Find the actual top module name (may have escaped backslash)
-    actual_top = None
-    for mod_name in modules.keys():
-        if mod_name.lstrip("\\") == top_module or mod_name == top_module:
-            actual_top = mod_name
-            break
-
-    if not actual_top:
-        # Use first module if top not found
-        actual_top = list(modules.keys())[0] if modules else top_module
-        logger.warning(
-            f"Top module '{top_module}' not found in JSON, using '{actual_top}'"
-        )
-
-    return Netlist(
-        modules=modules,
-        top_module=actual_top,
-        json_data=json_data,
-    )
+"""Synthesis module for converting RTL to gate-level netlist using Yosys."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import mmap
+import os
+import shutil
+import string
+import subprocess  # nosec B404
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional accelerator
+    ijson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+# Above this size, parse JSON straight out of an mmap instead of copying
+# the file into a bytes object first.
+_MMAP_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+
+def _load_json_file(path: Path) -> Dict[str, Any]:
+    """Load a JSON file, using orjson and mmap when they pay off.
+
+    orjson parses large Yosys outputs severalfold faster than the stdlib
+    and skips the intermediate decoded string; its decode errors subclass
+    json.JSONDecodeError, so callers' except clauses work unchanged. Files
+    over the mmap threshold are parsed zero-copy out of a read-only map,
+    halving peak memory during the parse.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return orjson.loads(memoryview(mm))
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Above this size, stream the Yosys JSON module-by-module instead of
+# materializing the whole document (requires ijson).
+_STREAMING_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Synthesis script template, parsed once at import
+_SCRIPT_TMPL = string.Template(
+    """# Yosys synthesis script
+$read_cmd
+hierarchy -check -top $top
+flatten
+$opt_cmds
+write_json "$netlist"
+"""
+)
+
+# Resolved once: tempfile.gettempdir() re-probes env vars per call
+_DEFAULT_TMP = Path(tempfile.gettempdir())
+
+# Cache of Yosys JSON outputs keyed by a content hash of all synthesis
+# inputs, so identical re-runs skip the Yosys subprocess entirely. The
+# directory is pruned to the newest entries after each write.
+_SYNTH_CACHE_DIR = Path.home() / ".cache" / "verilog2spice"
+_SYNTH_CACHE_MAX_ENTRIES = 32
+
+
+def _prune_synth_cache() -> None:
+    """Delete the oldest cached netlists beyond the entry cap.
+
+    Failures are ignored - pruning is housekeeping, not correctness.
+    """
+    try:
+        entries = sorted(
+            _SYNTH_CACHE_DIR.glob("synth_*.json"),
+            key=lambda path: path.stat().st_mtime_ns,
+        )
+        for stale in entries[: max(0, len(entries) - _SYNTH_CACHE_MAX_ENTRIES)]:
+            stale.unlink()
+    except OSError as e:
+        logger.debug(f"Could not prune synthesis cache: {e}")
+
+# Replacement for subprocess.run in run_yosys, installed via set_runner.
+# None means "use the real subprocess.run", resolved at call time so test
+# patches of subprocess.run keep working.
+_runner: Optional[Callable[..., "subprocess.CompletedProcess[str]"]] = None
+
+
+def set_runner(
+    runner: Optional[Callable[..., "subprocess.CompletedProcess[str]"]],
+) -> None:
+    """Install a replacement Yosys runner, or reset with None.
+
+    Tests inject a fake that drops a pre-baked netlist.json instead of
+    spawning a Yosys process (see the fake_yosys fixture).
+
+    Args:
+        runner: subprocess.run-compatible callable, or None for the default
+    """
+    global _runner
+    _runner = runner
+
+
+# In-process LRU of parsed Netlists keyed by a cheap stat-based input
+# fingerprint, so re-synthesizing an unchanged design in one run skips
+# even the JSON reload.
+_NETLIST_CACHE: "OrderedDict[str, Netlist]" = OrderedDict()
+_NETLIST_CACHE_MAX = 16
+_NETLIST_CACHE_LOCK = threading.Lock()
+
+
+class Netlist:
+    """Gate-level netlist representation.
+
+    Attributes:
+        modules: Dictionary of modules in the netlist
+        top_module: Name of the top-level module
+        json_data: Raw Yosys JSON data
+    """
+
+    def __init__(
+        self,
+        modules: Optional[Dict[str, Any]] = None,
+        top_module: Optional[str] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize Netlist.
+
+        Args:
+            modules: Dictionary of modules
+            top_module: Top-level module name
+            json_data: Raw Yosys JSON data
+        """
+        self.modules = modules or {}
+        self.top_module = top_module
+        self.json_data = json_data or {}
+
+
+@functools.lru_cache(maxsize=1)
+def check_yosys() -> bool:
+    """Check if Yosys is available.
+
+    The result is cached for the process lifetime - availability does not
+    change mid-run, and probing spawns a subprocess. Use
+    check_yosys.cache_clear() to force a re-probe.
+
+    Returns:
+        True if Yosys is available, False otherwise
+    """
+    try:
+        result = subprocess.run(  # nosec B603, B607
+            ["yosys", "-V"],
+            capture_output=True,
+            check=False,
+            timeout=5,
+        )
+        return result.returncode == 0
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+
+
+def _netlist_memo_key(
+    verilog_files: List[str],
+    top_module: str,
+    script: Optional[str],
+    optimize: bool,
+    include_paths: Optional[List[str]],
+    defines: Optional[Dict[str, str]],
+) -> Optional[str]:
+    """Fingerprint synthesis inputs from stat data, without reading files.
+
+    (path, mtime_ns, size) per source plus the flag tuple is enough to
+    detect the edited-one-file case; the content-hashed disk cache still
+    backs anything this cheaper check misses.
+
+    Args:
+        verilog_files: List of Verilog file paths
+        top_module: Top-level module name
+        script: Optional custom Yosys synthesis script path
+        optimize: Whether optimization is enabled
+        include_paths: Optional list of include paths
+        defines: Optional dictionary of preprocessor defines
+
+    Returns:
+        Fingerprint string, or None when inputs cannot be stat'd
+    """
+    hasher = hashlib.sha256()
+    try:
+        for verilog_file in sorted(verilog_files):
+            stat = os.stat(verilog_file)
+            hasher.update(
+                f"{verilog_file}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+            )
+        if script:
+            stat = os.stat(script)
+            hasher.update(f"{script}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    except OSError:
+        return None
+    hasher.update(top_module.encode())
+    hasher.update(b"opt" if optimize else b"noopt")
+    for include_path in sorted(include_paths or []):
+        hasher.update(include_path.encode())
+    for name, value in sorted((defines or {}).items()):
+        hasher.update(f"{name}={value}".encode())
+    return hasher.hexdigest()
+
+
+def _store_netlist_memo(memo_key: Optional[str], netlist: Netlist) -> None:
+    """Insert a Netlist into the in-process LRU, evicting the oldest.
+
+    Args:
+        memo_key: Fingerprint from _netlist_memo_key, or None to skip
+        netlist: Parsed netlist to cache
+    """
+    if memo_key is None:
+        return
+    with _NETLIST_CACHE_LOCK:
+        _NETLIST_CACHE[memo_key] = netlist
+        _NETLIST_CACHE.move_to_end(memo_key)
+        while len(_NETLIST_CACHE) > _NETLIST_CACHE_MAX:
+            _NETLIST_CACHE.popitem(last=False)
+
+
+def _synthesis_cache_path(
+    verilog_files: List[str],
+    top_module: str,
+    script: Optional[str],
+    optimize: bool,
+    include_paths: Optional[List[str]],
+    defines: Optional[Dict[str, str]],
+) -> Optional[Path]:
+    """Compute the cache file path for a synthesis input combination.
+
+    The key is a SHA-256 over the source file contents and every input
+    that influences the Yosys run, so a hit is valid by construction.
+
+    Args:
+        verilog_files: List of Verilog file paths
+        top_module: Top-level module name
+        script: Optional custom Yosys synthesis script path
+        optimize: Whether optimization is enabled
+        include_paths: Optional list of include paths
+        defines: Optional dictionary of preprocessor defines
+
+    Returns:
+        Cache file path, or None when inputs cannot be hashed
+    """
+    hasher = hashlib.sha256()
+    try:
+        for verilog_file in sorted(verilog_files):
+            hasher.update(verilog_file.encode())
+            hasher.update(Path(verilog_file).read_bytes())
+        if script:
+            hasher.update(Path(script).read_bytes())
+    except OSError:
+        # Unreadable inputs: let the normal path produce the real error
+        return None
+    hasher.update(top_module.encode())
+    hasher.update(b"opt" if optimize else b"noopt")
+    for include_path in sorted(include_paths or []):
+        hasher.update(include_path.encode())
+    for name, value in sorted((defines or {}).items()):
+        hasher.update(f"{name}={value}".encode())
+    return _SYNTH_CACHE_DIR / f"synth_{hasher.hexdigest()[:32]}.json"
+
+
+def synthesize(
+    verilog_files: List[str],
+    top_module: str,
+    script: Optional[str] = None,
+    optimize: bool = True,
+    output_dir: Optional[str] = None,
+    include_paths: Optional[List[str]] = None,
+    defines: Optional[Dict[str, str]] = None,
+    use_cache: bool = True,
+    rtlil_cache_dir: Optional[str] = None,
+) -> Netlist:
+    """Synthesize Verilog RTL to gate-level netlist using Yosys.
+
+    Args:
+        verilog_files: List of Verilog file paths
+        top_module: Top-level module name
+        script: Optional custom Yosys synthesis script path
+        optimize: Whether to enable optimization
+        output_dir: Optional output directory for temporary files
+        include_paths: Optional list of include paths
+        defines: Optional dictionary of preprocessor defines
+        use_cache: If True, reuse the cached Yosys JSON output when all
+            synthesis inputs are byte-identical to a previous run
+        rtlil_cache_dir: Optional directory for front-end RTLIL
+            intermediates, keyed by the input fingerprint; re-synthesis of
+            an unchanged design then skips elaboration and starts from
+            techmap (requires use_cache)
+
+    Returns:
+        Netlist object containing gate-level representation
+
+    Raises:
+        RuntimeError: If synthesis fails or Yosys is not available
+    """
+    logger.info(f"Synthesizing design with top module: {top_module}")
+
+    # Check if Yosys is available
+    if not check_yosys():
+        raise RuntimeError(
+            "Yosys is required but not found. "
+            "Please install Yosys: sudo apt-get install yosys (Linux) or brew install yosys (macOS)"
+        )
+
+    # In-process memo: unchanged inputs return the parsed Netlist directly
+    memo_key = None
+    cache_path = None
+    if use_cache:
+        memo_key = _netlist_memo_key(
+            verilog_files, top_module, script, optimize, include_paths, defines
+        )
+        if memo_key is not None:
+            with _NETLIST_CACHE_LOCK:
+                cached_netlist = _NETLIST_CACHE.get(memo_key)
+                if cached_netlist is not None:
+                    _NETLIST_CACHE.move_to_end(memo_key)
+                    logger.info("In-process synthesis cache hit")
+                    return cached_netlist
+
+        # Input-hash disk cache: identical inputs reuse the stored Yosys JSON
+        cache_path = _synthesis_cache_path(
+            verilog_files, top_module, script, optimize, include_paths, defines
+        )
+        if cache_path is not None and cache_path.exists():
+            try:
+                json_data = _load_json_file(cache_path)
+                logger.info("Synthesis cache hit; skipping Yosys invocation")
+                netlist = parse_yosys_json(json_data, top_module)
+                _store_netlist_memo(memo_key, netlist)
+                return netlist
+            except (json.JSONDecodeError, OSError) as e:
+                logger.debug(f"Ignoring unreadable synthesis cache entry: {e}")
+
+    # Use custom script or default
+    if script and Path(script).exists():
+        script_path = script
+        logger.info(f"Using custom synthesis script: {script_path}")
+        # Extract output path from script or use default
+        if output_dir:
+            netlist_path = Path(output_dir) / "netlist.json"
+        else:
+            netlist_path = _DEFAULT_TMP / "netlist.json"
+    else:
+        rtlil_path = None
+        if rtlil_cache_dir and memo_key is not None:
+            rtlil_path = Path(rtlil_cache_dir) / f"front_{memo_key[:32]}.il"
+        # Inline commands via -p: no script file write/read round-trip
+        script_path, netlist_path = build_synthesis_commands(
+            verilog_files,
+            top_module,
+            optimize,
+            output_dir,
+            include_paths,
+            defines,
+            rtlil_cache=rtlil_path,
+        )
+
+    # Run Yosys
+    try:
+        run_yosys(script_path)
+
+        # Read and parse JSON output
+        if not netlist_path.exists():
+            raise RuntimeError(f"Yosys JSON output file not found: {netlist_path}")
+
+        if (
+            ijson is not None
+            and netlist_path.stat().st_size > _STREAMING_THRESHOLD_BYTES
+        ):
+            netlist = parse_yosys_json_streaming(netlist_path, top_module)
+        else:
+            json_data = _load_json_file(netlist_path)
+            netlist = parse_yosys_json(json_data, top_module)
+
+        if cache_path is not None:
+            try:
+                _SYNTH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_name(
+                    f"{cache_path.name}.{os.getpid()}.tmp"
+                )
+                shutil.copyfile(netlist_path, tmp_path)
+                os.replace(tmp_path, cache_path)
+                _prune_synth_cache()
+            except OSError as e:
+                logger.debug(f"Could not write synthesis cache: {e}")
+
+        _store_netlist_memo(memo_key, netlist)
+        logger.info("Synthesis completed successfully")
+        return netlist
+
+    except (
+        subprocess.TimeoutExpired,
+        subprocess.CalledProcessError,
+        FileNotFoundError,
+        json.JSONDecodeError,
+        OSError,
+    ) as e:
+        logger.error(f"Synthesis failed: {e}")
+        raise RuntimeError(f"Synthesis failed: {e}") from e
+
+
+@functools.lru_cache(maxsize=64)
+def _build_read_cmd_cached(
+    files_tuple: Tuple[str, ...],
+    includes_tuple: Tuple[str, ...],
+    defines_tuple: Tuple[Tuple[str, str], ...],
+) -> str:
+    """Build the read_verilog command from hashable argument tuples.
+
+    Cached because sweeps over optimize/top_module reuse the same file
+    set, include paths, and defines on every call.
+
+    Args:
+        files_tuple: Verilog file paths
+        includes_tuple: Include paths
+        defines_tuple: (name, value) preprocessor defines
+
+    Returns:
+        Complete read_verilog command string
+    """
+    read_cmd_parts = ["read_verilog"]
+
+    # Add include paths
+    for inc_path in includes_tuple:
+        read_cmd_parts.append(f"-I{inc_path}")
+
+    # Add defines
+    for name, value in defines_tuple:
+        read_cmd_parts.append(f"-D{name}={value}")
+
+    # Add Verilog files
+    read_cmd_parts.extend(files_tuple)
+    return " ".join(read_cmd_parts)
+
+
+def _build_read_verilog_cmd(
+    verilog_files: List[str],
+    include_paths: Optional[List[str]] = None,
+    defines: Optional[Dict[str, str]] = None,
+) -> str:
+    """Build the read_verilog command with includes and defines.
+
+    Args:
+        verilog_files: List of Verilog file paths
+        include_paths: Optional list of include paths
+        defines: Optional dictionary of preprocessor defines
+
+    Returns:
+        Complete read_verilog command string
+    """
+    return _build_read_cmd_cached(
+        tuple(verilog_files),
+        tuple(include_paths or ()),
+        tuple((defines or {}).items()),
+    )
+
+
+def build_synthesis_commands(
+    verilog_files: List[str],
+    top_module: str,
+    optimize: bool,
+    output_dir: Optional[str],
+    include_paths: Optional[List[str]] = None,
+    defines: Optional[Dict[str, str]] = None,
+    rtlil_cache: Optional[Path] = None,
+) -> Tuple[List[str], Path]:
+    """Build the default synthesis command list without writing a script.
+
+    The commands are meant for `yosys -p`, so the default synthesis path
+    never round-trips through a synthesis.ys file on disk. When an RTLIL
+    cache path is given, the front-end passes (elaboration through the
+    pre-techmap opts) write their result there, and a pre-existing cache
+    file replaces them entirely with a read_rtlil, leaving only the
+    back-end techmap/opt and JSON write to run.
+
+    Args:
+        verilog_files: List of Verilog file paths
+        top_module: Top-level module name
+        optimize: Whether to enable optimization
+        output_dir: Optional output directory
+        include_paths: Optional list of include paths
+        defines: Optional dictionary of preprocessor defines
+        rtlil_cache: Optional path for the front-end RTLIL intermediate
+
+    Returns:
+        Tuple of (command list, netlist_json_path)
+    """
+    if output_dir:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+    else:
+        output_path = _DEFAULT_TMP
+
+    netlist_path = output_path / "netlist.json"
+
+    if rtlil_cache is not None and rtlil_cache.exists():
+        # Front end already cached: skip elaboration entirely
+        commands = [f'read_rtlil "{rtlil_cache}"']
+        if optimize:
+            commands.append("techmap; opt")
+        commands.append(f'write_json "{netlist_path}"')
+        return commands, netlist_path
+
+    commands = [
+        _build_read_verilog_cmd(verilog_files, include_paths, defines),
+        f"hierarchy -check -top {top_module}",
+        "flatten",
+    ]
+    if optimize:
+        commands.append("proc; opt; fsm; opt; memory; opt")
+    if rtlil_cache is not None:
+        rtlil_cache.parent.mkdir(parents=True, exist_ok=True)
+        commands.append(f'write_rtlil "{rtlil_cache}"')
+    if optimize:
+        commands.append("techmap; opt")
+    commands.append(f'write_json "{netlist_path}"')
+
+    return commands, netlist_path
+
+
+def create_default_synthesis_script(
+    verilog_files: List[str],
+    top_module: str,
+    optimize: bool,
+    output_dir: Optional[str],
+    include_paths: Optional[List[str]] = None,
+    defines: Optional[Dict[str, str]] = None,
+) -> tuple[str, Path]:
+    """Create a default Yosys synthesis script.
+
+    Args:
+        verilog_files: List of Verilog file paths
+        top_module: Top-level module name
+        optimize: Whether to enable optimization
+        output_dir: Optional output directory
+        include_paths: Optional list of include paths
+        defines: Optional dictionary of preprocessor defines
+
+    Returns:
+        Tuple of (script_path, netlist_json_path)
+    """
+    if output_dir:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+    else:
+        output_path = _DEFAULT_TMP
+
+    script_path = output_path / "synthesis.ys"
+    netlist_path = output_path / "netlist.json"
+
+    read_cmd = _build_read_verilog_cmd(verilog_files, include_paths, defines)
+
+    # Build optimization commands
+    opt_cmds = ""
+    if optimize:
+        opt_cmds = """
+proc; opt; fsm; opt; memory; opt
+techmap; opt
+"""
+
+    script_content = _SCRIPT_TMPL.substitute(
+        read_cmd=read_cmd,
+        top=top_module,
+        opt_cmds=opt_cmds,
+        netlist=netlist_path,
+    )
+
+    # One unbuffered byte write; the script is ASCII by construction
+    script_path.write_bytes(script_content.encode("ascii", errors="replace"))
+    logger.debug(f"Created synthesis script: {script_path}")
+
+    return str(script_path), netlist_path
+
+
+@dataclass
+class SynthConfig:
+    """One synthesis configuration for synthesize_many.
+
+    Attributes mirror the arguments of synthesize().
+
+    Attributes:
+        verilog_files: List of Verilog file paths
+        top_module: Top-level module name
+        script: Optional custom Yosys synthesis script path
+        optimize: Whether to enable optimization
+        output_dir: Optional output directory for temporary files
+        include_paths: Optional list of include paths
+        defines: Optional dictionary of preprocessor defines
+    """
+
+    verilog_files: List[str]
+    top_module: str
+    script: Optional[str] = None
+    optimize: bool = True
+    output_dir: Optional[str] = None
+    include_paths: Optional[List[str]] = None
+    defines: Optional[Dict[str, str]] = None
+
+
+def run_yosys_async(script_path: str) -> "subprocess.Popen[str]":
+    """Start Yosys on a script without blocking.
+
+    Args:
+        script_path: Path to Yosys script
+
+    Returns:
+        Popen handle; the caller must communicate() and check returncode
+    """
+    logger.debug(f"Launching Yosys with script: {script_path}")
+    return subprocess.Popen(  # nosec B603, B607
+        ["yosys", "-s", script_path],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def synthesize_many(
+    configs: List[SynthConfig],
+    max_parallel: Optional[int] = None,
+) -> List[Netlist]:
+    """Synthesize several independent configurations in parallel.
+
+    Yosys itself is single-threaded, so a sweep over optimization flags,
+    top modules, or libraries runs as up to min(len(configs), cpu_count)
+    concurrent Yosys subprocesses. Each configuration without an explicit
+    output_dir gets a private temporary directory, so scripts and netlist
+    files never collide.
+
+    Args:
+        configs: Synthesis configurations to run
+        max_parallel: Optional cap on concurrent Yosys processes
+
+    Returns:
+        Netlist objects in the same order as `configs`
+
+    Raises:
+        RuntimeError: If any synthesis fails or Yosys is not available
+    """
+    if not check_yosys():
+        raise RuntimeError(
+            "Yosys is required but not found. "
+            "Please install Yosys: sudo apt-get install yosys (Linux) or brew install yosys (macOS)"
+        )
+
+    limit = max(1, min(len(configs), max_parallel or os.cpu_count() or 1))
+    results: List[Optional[Netlist]] = [None] * len(configs)
+    active: List[Tuple[int, "subprocess.Popen[str]", Path]] = []
+
+    def _launch(index: int) -> Tuple[int, "subprocess.Popen[str]", Path]:
+        config = configs[index]
+        output_dir = config.output_dir or tempfile.mkdtemp(
+            prefix=f"v2s_synth_{index}_"
+        )
+        if config.script and Path(config.script).exists():
+            script_path = config.script
+            netlist_path = Path(output_dir) / "netlist.json"
+        else:
+            script_path, netlist_path = create_default_synthesis_script(
+                config.verilog_files,
+                config.top_module,
+                config.optimize,
+                output_dir,
+                config.include_paths,
+                config.defines,
+            )
+        return (index, run_yosys_async(script_path), netlist_path)
+
+    next_index = 0
+    try:
+        while next_index < len(configs) or active:
+            while next_index < len(configs) and len(active) < limit:
+                active.append(_launch(next_index))
+                next_index += 1
+
+            index, proc, netlist_path = active.pop(0)
+            try:
+                _, stderr = proc.communicate(timeout=300)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                raise RuntimeError("Yosys execution timed out")
+            if proc.returncode != 0:
+                raise RuntimeError(f"Yosys execution failed: {stderr}")
+            if not netlist_path.exists():
+                raise RuntimeError(
+                    f"Yosys JSON output file not found: {netlist_path}"
+                )
+
+            json_data = _load_json_file(netlist_path)
+            results[index] = parse_yosys_json(
+                json_data, configs[index].top_module
+            )
+    finally:
+        # On failure, reap any still-running Yosys processes
+        for _, proc, _ in active:
+            proc.kill()
+
+    return [netlist for netlist in results if netlist is not None]
+
+
+class YosysServer:
+    """Long-lived Yosys process driven through stdin.
+
+    Keeps one `yosys -q` process alive and sends a command batch per
+    design, so repeated small syntheses skip the per-call process spawn
+    and built-in library loading. State is cleared with `design -reset`
+    between designs.
+
+    Usage:
+        with YosysServer() as server:
+            netlist = synthesize_on(server, ["adder.v"], "adder")
+    """
+
+    def __init__(self) -> None:
+        """Initialize the server without starting the process."""
+        self._process: Optional["subprocess.Popen[str]"] = None
+
+    def __enter__(self) -> "YosysServer":
+        """Start the Yosys process."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """Stop the Yosys process."""
+        self.stop()
+
+    def start(self) -> None:
+        """Start the Yosys process if not already running.
+
+        Raises:
+            RuntimeError: If Yosys is not available
+        """
+        if self._process is not None:
+            return
+        if not check_yosys():
+            raise RuntimeError(
+                "Yosys is required but not found. "
+                "Please install Yosys: sudo apt-get install yosys (Linux) or brew install yosys (macOS)"
+            )
+        self._process = subprocess.Popen(  # nosec B603, B607
+            ["yosys", "-q"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+
+    def stop(self) -> None:
+        """Shut the Yosys process down, forcefully if needed."""
+        proc = self._process
+        if proc is None:
+            return
+        self._process = None
+        try:
+            if proc.stdin:
+                proc.stdin.write("exit\n")
+                proc.stdin.flush()
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+    def run_commands(self, commands: List[str]) -> None:
+        """Run a command batch, blocking until Yosys confirms completion.
+
+        A unique log sentinel is appended to the batch; output is consumed
+        until the sentinel appears, which also keeps the pipe drained.
+
+        Args:
+            commands: Yosys commands to execute in order
+
+        Raises:
+            RuntimeError: If the server is not running or exits mid-batch
+        """
+        proc = self._process
+        if proc is None or proc.poll() is not None or not proc.stdin:
+            raise RuntimeError("Yosys server is not running")
+
+        sentinel = f"DONE_{uuid.uuid4().hex}"
+        proc.stdin.write("\n".join(commands) + f"\nlog {sentinel}\n")
+        proc.stdin.flush()
+
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            if sentinel in line:
+                return
+
+        raise RuntimeError("Yosys server exited unexpectedly")
+
+
+def synthesize_on(
+    server: YosysServer,
+    verilog_files: List[str],
+    top_module: str,
+    optimize: bool = True,
+    output_dir: Optional[str] = None,
+    include_paths: Optional[List[str]] = None,
+    defines: Optional[Dict[str, str]] = None,
+) -> Netlist:
+    """Synthesize one design on a long-lived Yosys server.
+
+    Args:
+        server: Running YosysServer to synthesize on
+        verilog_files: List of Verilog file paths
+        top_module: Top-level module name
+        optimize: Whether to enable optimization
+        output_dir: Optional output directory for the netlist JSON
+        include_paths: Optional list of include paths
+        defines: Optional dictionary of preprocessor defines
+
+    Returns:
+        Netlist object containing gate-level representation
+
+    Raises:
+        RuntimeError: If synthesis fails
+    """
+    logger.info(f"Synthesizing design on Yosys server: {top_module}")
+
+    if output_dir:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+    else:
+        output_path = Path(tempfile.mkdtemp(prefix="v2s_server_"))
+    netlist_path = output_path / "netlist.json"
+
+    commands = [
+        "design -reset",
+        _build_read_verilog_cmd(verilog_files, include_paths, defines),
+        f"hierarchy -check -top {top_module}",
+        "flatten",
+    ]
+    if optimize:
+        commands += ["proc; opt; fsm; opt; memory; opt", "techmap; opt"]
+    commands.append(f'write_json "{netlist_path}"')
+
+    server.run_commands(commands)
+
+    if not netlist_path.exists():
+        raise RuntimeError(f"Yosys JSON output file not found: {netlist_path}")
+
+    json_data = _load_json_file(netlist_path)
+    return parse_yosys_json(json_data, top_module)
+
+
+def synthesize_batch(jobs: List[SynthConfig]) -> List[Netlist]:
+    """Synthesize several designs in one Yosys invocation.
+
+    The per-design command sequences are concatenated with `design -reset`
+    between them and run as a single `yosys -p` process, so the Yosys
+    startup cost (process spawn, built-in cell library load) is paid once
+    for the whole batch. Use synthesize_many instead when the designs
+    should run concurrently.
+
+    Args:
+        jobs: Synthesis configurations to run back to back
+
+    Returns:
+        Netlist objects in the same order as `jobs`
+
+    Raises:
+        RuntimeError: If Yosys is not available or the batch fails
+    """
+    if not jobs:
+        return []
+
+    if not check_yosys():
+        raise RuntimeError(
+            "Yosys is required but not found. "
+            "Please install Yosys: sudo apt-get install yosys (Linux) or brew install yosys (macOS)"
+        )
+
+    commands: List[str] = []
+    netlist_paths: List[Path] = []
+    for index, job in enumerate(jobs):
+        output_dir = job.output_dir or tempfile.mkdtemp(
+            prefix=f"v2s_batch_{index}_"
+        )
+        job_commands, netlist_path = build_synthesis_commands(
+            job.verilog_files,
+            job.top_module,
+            job.optimize,
+            output_dir,
+            job.include_paths,
+            job.defines,
+        )
+        commands.append("design -reset")
+        commands.extend(job_commands)
+        netlist_paths.append(netlist_path)
+
+    logger.info(f"Synthesizing {len(jobs)} designs in one Yosys invocation")
+    run_yosys(commands)
+
+    netlists: List[Netlist] = []
+    for job, netlist_path in zip(jobs, netlist_paths):
+        if not netlist_path.exists():
+            raise RuntimeError(
+                f"Yosys JSON output file not found: {netlist_path}"
+            )
+        json_data = _load_json_file(netlist_path)
+        netlists.append(parse_yosys_json(json_data, job.top_module))
+
+    return netlists
+
+
+async def run_yosys_asyncio(
+    script_path: Union[str, List[str]],
+    timeout: float = 300,
+) -> None:
+    """Run Yosys without blocking the event loop.
+
+    The asyncio counterpart of run_yosys: callers can supervise many
+    Yosys processes with asyncio.gather and cancel them cooperatively
+    instead of parking one thread per 5-minute blocking timeout.
+
+    Args:
+        script_path: Path to a Yosys script, or a list of commands to run
+            inline via `yosys -p`
+        timeout: Seconds to wait before terminating the process
+
+    Raises:
+        RuntimeError: If Yosys execution fails or times out
+    """
+    if isinstance(script_path, list):
+        args = ["-p", "; ".join(script_path)]
+        logger.debug(f"Running Yosys with {len(script_path)} inline commands")
+    else:
+        args = ["-s", script_path]
+        logger.debug(f"Running Yosys with script: {script_path}")
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "yosys",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        raise RuntimeError("Yosys not found in PATH")
+
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.terminate()
+        await proc.wait()
+        raise RuntimeError("Yosys execution timed out")
+
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"Yosys execution failed: {stderr.decode(errors='replace')}"
+        )
+
+    logger.debug("Yosys execution completed")
+
+
+async def synthesize_async(
+    verilog_files: List[str],
+    top_module: str,
+    optimize: bool = True,
+    output_dir: Optional[str] = None,
+    include_paths: Optional[List[str]] = None,
+    defines: Optional[Dict[str, str]] = None,
+    timeout: float = 300,
+) -> Netlist:
+    """Asynchronous counterpart of synthesize()'s default path.
+
+    Compose with asyncio.gather for N-way synthesis fan-out without a
+    process pool or a blocked thread per run. Each call without an
+    explicit output_dir gets a private temporary directory so concurrent
+    runs never collide.
+
+    Args:
+        verilog_files: List of Verilog file paths
+        top_module: Top-level module name
+        optimize: Whether to enable optimization
+        output_dir: Optional output directory for temporary files
+        include_paths: Optional list of include paths
+        defines: Optional dictionary of preprocessor defines
+        timeout: Seconds to wait before terminating Yosys
+
+    Returns:
+        Netlist object containing gate-level representation
+
+    Raises:
+        RuntimeError: If synthesis fails or Yosys is not available
+    """
+    if not check_yosys():
+        raise RuntimeError(
+            "Yosys is required but not found. "
+            "Please install Yosys: sudo apt-get install yosys (Linux) or brew install yosys (macOS)"
+        )
+
+    commands, netlist_path = build_synthesis_commands(
+        verilog_files,
+        top_module,
+        optimize,
+        output_dir or tempfile.mkdtemp(prefix="v2s_async_"),
+        include_paths,
+        defines,
+    )
+
+    await run_yosys_asyncio(commands, timeout=timeout)
+
+    if not netlist_path.exists():
+        raise RuntimeError(f"Yosys JSON output file not found: {netlist_path}")
+
+    json_data = _load_json_file(netlist_path)
+    return parse_yosys_json(json_data, top_module)
+
+
+def run_yosys(script_path: Union[str, List[str]]) -> None:
+    """Run Yosys with the given script or inline command list.
+
+    Args:
+        script_path: Path to a Yosys script, or a list of commands to run
+            inline via `yosys -p` (no script file involved)
+
+    Raises:
+        RuntimeError: If Yosys execution fails
+    """
+    if isinstance(script_path, list):
+        cmd = ["yosys", "-p", "; ".join(script_path)]
+        logger.debug(f"Running Yosys with {len(script_path)} inline commands")
+    else:
+        cmd = ["yosys", "-s", script_path]
+        logger.debug(f"Running Yosys with script: {script_path}")
+
+    run = _runner if _runner is not None else subprocess.run
+
+    try:
+        result = run(  # nosec B603, B607
+            cmd,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=300,  # 5 minute timeout
+        )
+
+        if result.returncode != 0:
+            raise RuntimeError(f"Yosys failed: {result.stderr}")
+
+        logger.debug("Yosys execution completed")
+        if result.stderr:
+            logger.debug(f"Yosys warnings: {result.stderr}")
+
+    except subprocess.TimeoutExpired:
+        raise RuntimeError("Yosys execution timed out")
+    except FileNotFoundError:
+        raise RuntimeError("Yosys not found in PATH")
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Yosys execution failed: {e.stderr}")
+
+
+class LazyModuleDict(Mapping[str, Any]):
+    """Mapping over a Yosys JSON file that loads modules on demand.
+
+    The streaming parse materializes only the top module eagerly; any
+    other module is streamed out of the file on first access and cached.
+    Single-top consumers therefore never hold the full design, while
+    multi-module consumers keep working against the same mapping API.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        module_names: List[str],
+        loaded: Dict[str, Any],
+    ) -> None:
+        """Initialize the lazy view.
+
+        Args:
+            path: Path to the Yosys JSON file
+            module_names: All module names present in the file, in order
+            loaded: Modules already materialized (typically just the top)
+        """
+        self._path = Path(path)
+        self._names = list(module_names)
+        self._loaded = dict(loaded)
+
+    def __contains__(self, name: object) -> bool:
+        """Check module existence without loading anything."""
+        return name in self._names
+
+    def __len__(self) -> int:
+        """Number of modules in the file."""
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate module names without loading bodies."""
+        return iter(self._names)
+
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        """Get a module's data, streaming it from the file on first access.
+
+        Args:
+            name: Module name
+
+        Returns:
+            The module's JSON data
+
+        Raises:
+            KeyError: If the module is not in the file
+        """
+        module = self._loaded.get(name)
+        if module is not None:
+            return module
+        if name not in self._names:
+            raise KeyError(name)
+
+        if ijson is None:
+            module = _load_json_file(self._path).get("modules", {}).get(name)
+        else:
+            with open(self._path, "rb") as f:
+                for mod_name, module_data in ijson.kvitems(f, "modules"):
+                    if mod_name == name:
+                        module = module_data
+                        break
+        if module is None:
+            raise KeyError(name)
+        self._loaded[name] = module
+        return module
+
+
+def parse_yosys_json_streaming(path: Path, top_module: str) -> Netlist:
+    """Parse a Yosys JSON file incrementally, keeping only the top module.
+
+    Modules are streamed one at a time with ijson and discarded unless
+    they match `top_module`, so peak memory is bounded by the largest
+    single module instead of the whole document. Falls back to the full
+    parse when ijson is not installed.
+
+    Args:
+        path: Path to the Yosys JSON file
+        top_module: Top-level module name
+
+    Returns:
+        Netlist object holding only the resolved top module
+    """
+    if ijson is None:
+        return parse_yosys_json(_load_json_file(path), top_module)
+
+    logger.debug("Streaming Yosys JSON output")
+
+    module_names: List[str] = []
+    matched_name: Optional[str] = None
+    matched_data: Optional[Dict[str, Any]] = None
+    # First module kept as the fallback until a real match appears
+    first_data: Optional[Dict[str, Any]] = None
+
+    with open(path, "rb") as f:
+        for mod_name, module_data in ijson.kvitems(f, "modules"):
+            module_names.append(mod_name)
+            if matched_name is None and (
+                mod_name.lstrip("\\") == top_module or mod_name == top_module
+            ):
+                matched_name = mod_name
+                matched_data = module_data
+                first_data = None
+            elif first_data is None and matched_name is None:
+                first_data = module_data
+
+    if matched_name is not None:
+        actual_top = matched_name
+        loaded: Dict[str, Any] = {matched_name: matched_data}
+    elif module_names:
+        actual_top = module_names[0]
+        loaded = {actual_top: first_data}
+        logger.warning(
+            f"Top module '{top_module}' not found in JSON, using '{actual_top}'"
+        )
+    else:
+        actual_top = top_module
+        loaded = {}
+        logger.warning(
+            f"Top module '{top_module}' not found in JSON, using '{actual_top}'"
+        )
+
+    # Other modules stay on disk until someone actually dereferences them
+    modules = LazyModuleDict(path, module_names, loaded)
+
+    return Netlist(
+        modules=modules,
+        top_module=actual_top,
+        json_data={"modules": modules},
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_top(module_names: Tuple[str, ...], top_module: str) -> Tuple[str, bool]:
+    """Resolve the actual top module name from the module name list.
+
+    Args:
+        module_names: Module names from the Yosys JSON, in order
+        top_module: Requested top module name
+
+    Returns:
+        Tuple of (resolved module name, whether the top module was found);
+        when not found, the first module (or the requested name if there
+        are no modules) is returned as the fallback
+    """
+    # Two direct probes cover the Yosys escaping convention (a single
+    # leading backslash) without scanning every module name
+    candidates = frozenset(module_names)
+    if top_module in candidates:
+        return (top_module, True)
+    escaped = "\\" + top_module
+    if escaped in candidates:
+        return (escaped, True)
+    # Fallback scan for exotic names (e.g. multiple leading backslashes)
+    for mod_name in module_names:
+        if mod_name.lstrip("\\") == top_module:
+            return (mod_name, True)
+    if module_names:
+        return (module_names[0], False)
+    return (top_module, False)
+
+
+def parse_yosys_json(json_data: Dict[str, Any], top_module: str) -> Netlist:
+    """Parse Yosys JSON output into Netlist object.
+
+    Args:
+        json_data: Yosys JSON data structure
+        top_module: Top-level module name
+
+    Returns:
+        Netlist object
+    """
+    logger.debug("Parsing Yosys JSON output")
+
+    modules = json_data.get("modules", {})
+
+    # Find the actual top module name (may have escaped backslash); the
+    # resolution itself is cached since the same module list and top name
+    # recur across repeated parses of one design
+    actual_top, found = _resolve_top(tuple(modules), top_module)
+    if not found:
+        logger.warning(
+            f"Top module '{top_module}' not found in JSON, using '{actual_top}'"
+        )
+
+    return Netlist(
+        modules=modules,
+        top_module=actual_top,
+        json_data=json_data,
+    )
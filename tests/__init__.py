@@ -1 +1 @@
-"""Unit tests for Verilog to SPICE conversion package."""
+"""Unit tests for Verilog to SPICE conversion package."""
@@ -1,245 +1,601 @@
-"""Pytest configuration and shared fixtures."""
-
-from __future__ import annotations
-
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Generator
-
-import pytest
-
-if TYPE_CHECKING:
-    pass
-
-
-@pytest.fixture
-def sample_cell_library_data() -> Dict[str, Any]:
-    """Provide sample cell library data for testing.
-
-    Returns:
-        Dictionary containing sample cell library configuration.
-    """
-    return {
-        "technology": "generic",
-        "spice_file": "cells.spice",
-        "cells": {
-            "INV": {
-                "spice_model": "INV",
-                "pins": ["A", "Y"],
-                "parameters": ["W", "L"],
-                "description": "Inverter",
-            },
-            "NAND2": {
-                "spice_model": "NAND2",
-                "pins": ["A", "B", "Y"],
-                "parameters": ["W", "L"],
-                "description": "2-input NAND gate",
-            },
-            "AND2": {
-                "spice_model": "AND2",
-                "pins": ["A", "B", "Y"],
-                "parameters": ["W", "L"],
-                "description": "2-input AND gate",
-            },
-            "AND3": {
-                "spice_model": "AND3",
-                "pins": ["A", "B", "C", "Y"],
-                "parameters": ["W", "L"],
-                "description": "3-input AND gate",
-            },
-            "AND4": {
-                "spice_model": "AND4",
-                "pins": ["A", "B", "C", "D", "Y"],
-                "parameters": ["W", "L"],
-                "description": "4-input AND gate",
-            },
-            "OR2": {
-                "spice_model": "OR2",
-                "pins": ["A", "B", "Y"],
-                "parameters": ["W", "L"],
-                "description": "2-input OR gate",
-            },
-            "OR3": {
-                "spice_model": "OR3",
-                "pins": ["A", "B", "C", "Y"],
-                "parameters": ["W", "L"],
-                "description": "3-input OR gate",
-            },
-            "OR4": {
-                "spice_model": "OR4",
-                "pins": ["A", "B", "C", "D", "Y"],
-                "parameters": ["W", "L"],
-                "description": "4-input OR gate",
-            },
-            "NOR2": {
-                "spice_model": "NOR2",
-                "pins": ["A", "B", "Y"],
-                "parameters": ["W", "L"],
-                "description": "2-input NOR gate",
-            },
-            "NOR3": {
-                "spice_model": "NOR3",
-                "pins": ["A", "B", "C", "Y"],
-                "parameters": ["W", "L"],
-                "description": "3-input NOR gate",
-            },
-            "NOR4": {
-                "spice_model": "NOR4",
-                "pins": ["A", "B", "C", "D", "Y"],
-                "parameters": ["W", "L"],
-                "description": "4-input NOR gate",
-            },
-            "NAND3": {
-                "spice_model": "NAND3",
-                "pins": ["A", "B", "C", "Y"],
-                "parameters": ["W", "L"],
-                "description": "3-input NAND gate",
-            },
-            "NAND4": {
-                "spice_model": "NAND4",
-                "pins": ["A", "B", "C", "D", "Y"],
-                "parameters": ["W", "L"],
-                "description": "4-input NAND gate",
-            },
-            "MUX2": {
-                "spice_model": "MUX2",
-                "pins": ["A", "B", "S", "Y"],
-                "parameters": ["W", "L"],
-                "description": "2-input multiplexer",
-            },
-            "MUX4": {
-                "spice_model": "MUX4",
-                "pins": ["A", "B", "C", "D", "S0", "S1", "Y"],
-                "parameters": ["W", "L"],
-                "description": "4-input multiplexer",
-            },
-            "HA": {
-                "spice_model": "HA",
-                "pins": ["A", "B", "SUM", "CARRY"],
-                "parameters": ["W", "L"],
-                "description": "Half adder",
-            },
-            "FA": {
-                "spice_model": "FA",
-                "pins": ["A", "B", "CI", "SUM", "CARRY"],
-                "parameters": ["W", "L"],
-                "description": "Full adder",
-            },
-        },
-    }
-
-
-@pytest.fixture
-def sample_yosys_json() -> Dict[str, Any]:
-    """Provide sample Yosys JSON output for testing.
-
-    Returns:
-        Dictionary containing sample Yosys JSON structure.
-    """
-    return {
-        "modules": {
-            "test_module": {
-                "ports": {
-                    "clk": {"direction": "input", "bits": [0]},
-                    "rst": {"direction": "input", "bits": [1]},
-                    "data": {"direction": "input", "bits": [2]},
-                    "out": {"direction": "output", "bits": [3]},
-                },
-                "cells": {
-                    "$_NOT_0": {
-                        "type": "$_NOT_",
-                        "port_directions": {"A": "input", "Y": "output"},
-                        "connections": {"A": [2], "Y": [3]},
-                    },
-                    "$_AND_0": {
-                        "type": "$_AND_",
-                        "port_directions": {"A": "input", "B": "input", "Y": "output"},
-                        "connections": {"A": [4], "B": [5], "Y": [6]},
-                    },
-                },
-                "netnames": {
-                    "clk": {"bits": [0]},
-                    "rst": {"bits": [1]},
-                    "data": {"bits": [2]},
-                    "out": {"bits": [3]},
-                },
-            }
-        }
-    }
-
-
-@pytest.fixture
-def sample_spice_content() -> str:
-    """Provide sample SPICE subcircuit content for testing.
-
-    Returns:
-        String containing sample SPICE subcircuit definitions.
-    """
-    return """* Sample SPICE subcircuit
-.SUBCKT INV A Y
-M1 Y A VDD VDD PMOS W=2u L=0.18u
-M2 Y A VSS VSS NMOS W=1u L=0.18u
-.ENDS INV
-
-.SUBCKT NAND2 A B Y
-M1 Y A VDD VDD PMOS W=2u L=0.18u
-M2 Y B VDD VDD PMOS W=2u L=0.18u
-M3 Y A net1 VSS NMOS W=1u L=0.18u
-M4 net1 B VSS VSS NMOS W=1u L=0.18u
-.ENDS NAND2
-
-.model NMOS NMOS (LEVEL=1 VTO=0.7)
-.model PMOS PMOS (LEVEL=1 VTO=-0.7)
-"""
-
-
-@pytest.fixture
-def temp_dir(tmp_path: Path) -> Generator[Path, None, None]:
-    """Provide a temporary directory for test files.
-
-    Args:
-        tmp_path: Pytest temporary path fixture.
-
-    Yields:
-        Path to temporary directory.
-    """
-    yield tmp_path
-
-
-@pytest.fixture
-def sample_cell_library_json_file(
-    temp_dir: Path, sample_cell_library_data: Dict[str, Any]
-) -> Generator[Path, None, None]:
-    """Create a temporary cell library JSON file for testing.
-
-    Args:
-        temp_dir: Temporary directory path.
-        sample_cell_library_data: Sample cell library data.
-
-    Yields:
-        Path to temporary JSON file.
-    """
-    import json
-
-    json_file = temp_dir / "cells.json"
-    json_file.write_text(
-        json.dumps(sample_cell_library_data, indent=2), encoding="utf-8"
-    )
-    yield json_file
-
-
-@pytest.fixture
-def sample_spice_file(
-    temp_dir: Path, sample_spice_content: str
-) -> Generator[Path, None, None]:
-    """Create a temporary SPICE file for testing.
-
-    Args:
-        temp_dir: Temporary directory path.
-        sample_spice_content: Sample SPICE content.
-
-    Yields:
-        Path to temporary SPICE file.
-    """
-    spice_file = temp_dir / "cells.spice"
-    spice_file.write_text(sample_spice_content, encoding="utf-8")
-    yield spice_file
+"""Pytest configuration and shared fixtures."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, Generator
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+if TYPE_CHECKING:
+    pass
+
+
+# Sample cell library used across the suite; serialized once at import so
+# the file fixture writes pre-baked bytes instead of re-running json.dumps.
+_CELL_LIBRARY_DATA: Dict[str, Any] = {
+    "technology": "generic",
+    "spice_file": "cells.spice",
+    "cells": {
+        "INV": {
+            "spice_model": "INV",
+            "pins": ["A", "Y"],
+            "parameters": ["W", "L"],
+            "description": "Inverter",
+        },
+        "NAND2": {
+            "spice_model": "NAND2",
+            "pins": ["A", "B", "Y"],
+            "parameters": ["W", "L"],
+            "description": "2-input NAND gate",
+        },
+        "AND2": {
+            "spice_model": "AND2",
+            "pins": ["A", "B", "Y"],
+            "parameters": ["W", "L"],
+            "description": "2-input AND gate",
+        },
+        "AND3": {
+            "spice_model": "AND3",
+            "pins": ["A", "B", "C", "Y"],
+            "parameters": ["W", "L"],
+            "description": "3-input AND gate",
+        },
+        "AND4": {
+            "spice_model": "AND4",
+            "pins": ["A", "B", "C", "D", "Y"],
+            "parameters": ["W", "L"],
+            "description": "4-input AND gate",
+        },
+        "OR2": {
+            "spice_model": "OR2",
+            "pins": ["A", "B", "Y"],
+            "parameters": ["W", "L"],
+            "description": "2-input OR gate",
+        },
+        "OR3": {
+            "spice_model": "OR3",
+            "pins": ["A", "B", "C", "Y"],
+            "parameters": ["W", "L"],
+            "description": "3-input OR gate",
+        },
+        "OR4": {
+            "spice_model": "OR4",
+            "pins": ["A", "B", "C", "D", "Y"],
+            "parameters": ["W", "L"],
+            "description": "4-input OR gate",
+        },
+        "NOR2": {
+            "spice_model": "NOR2",
+            "pins": ["A", "B", "Y"],
+            "parameters": ["W", "L"],
+            "description": "2-input NOR gate",
+        },
+        "NOR3": {
+            "spice_model": "NOR3",
+            "pins": ["A", "B", "C", "Y"],
+            "parameters": ["W", "L"],
+            "description": "3-input NOR gate",
+        },
+        "NOR4": {
+            "spice_model": "NOR4",
+            "pins": ["A", "B", "C", "D", "Y"],
+            "parameters": ["W", "L"],
+            "description": "4-input NOR gate",
+        },
+        "NAND3": {
+            "spice_model": "NAND3",
+            "pins": ["A", "B", "C", "Y"],
+            "parameters": ["W", "L"],
+            "description": "3-input NAND gate",
+        },
+        "NAND4": {
+            "spice_model": "NAND4",
+            "pins": ["A", "B", "C", "D", "Y"],
+            "parameters": ["W", "L"],
+            "description": "4-input NAND gate",
+        },
+        "MUX2": {
+            "spice_model": "MUX2",
+            "pins": ["A", "B", "S", "Y"],
+            "parameters": ["W", "L"],
+            "description": "2-input multiplexer",
+        },
+        "MUX4": {
+            "spice_model": "MUX4",
+            "pins": ["A", "B", "C", "D", "S0", "S1", "Y"],
+            "parameters": ["W", "L"],
+            "description": "4-input multiplexer",
+        },
+        "HA": {
+            "spice_model": "HA",
+            "pins": ["A", "B", "SUM", "CARRY"],
+            "parameters": ["W", "L"],
+            "description": "Half adder",
+        },
+        "FA": {
+            "spice_model": "FA",
+            "pins": ["A", "B", "CI", "SUM", "CARRY"],
+            "parameters": ["W", "L"],
+            "description": "Full adder",
+        },
+    },
+}
+
+_CELL_LIBRARY_JSON_BYTES = json.dumps(_CELL_LIBRARY_DATA, indent=2).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def _session_cell_library_data() -> Dict[str, Any]:
+    """Provide the sample cell library data, built once at import.
+
+    Returns:
+        Dictionary containing sample cell library configuration.
+    """
+    return _CELL_LIBRARY_DATA
+
+
+@pytest.fixture(scope="session")
+def _session_yosys_json() -> Dict[str, Any]:
+    """Build the sample Yosys JSON structure once per session.
+
+    Returns:
+        Dictionary containing sample Yosys JSON structure.
+    """
+    return {
+        "modules": {
+            "test_module": {
+                "ports": {
+                    "clk": {"direction": "input", "bits": [0]},
+                    "rst": {"direction": "input", "bits": [1]},
+                    "data": {"direction": "input", "bits": [2]},
+                    "out": {"direction": "output", "bits": [3]},
+                },
+                "cells": {
+                    "$_NOT_0": {
+                        "type": "$_NOT_",
+                        "port_directions": {"A": "input", "Y": "output"},
+                        "connections": {"A": [2], "Y": [3]},
+                    },
+                    "$_AND_0": {
+                        "type": "$_AND_",
+                        "port_directions": {"A": "input", "B": "input", "Y": "output"},
+                        "connections": {"A": [4], "B": [5], "Y": [6]},
+                    },
+                },
+                "netnames": {
+                    "clk": {"bits": [0]},
+                    "rst": {"bits": [1]},
+                    "data": {"bits": [2]},
+                    "out": {"bits": [3]},
+                },
+            }
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_cell_library_data(
+    _session_cell_library_data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Provide sample cell library data for testing.
+
+    The session-scoped dict is shared directly - the suite only reads it
+    (audited), and several tests json.dumps it, which rules out a
+    MappingProxyType wrapper. Deep-copy locally in any future test that
+    needs to mutate.
+
+    Returns:
+        Dictionary containing sample cell library configuration.
+    """
+    return _session_cell_library_data
+
+
+@pytest.fixture(scope="session")
+def sample_yosys_json(_session_yosys_json: Dict[str, Any]) -> Dict[str, Any]:
+    """Provide sample Yosys JSON output for testing.
+
+    Shared directly for the same reasons as sample_cell_library_data.
+
+    Returns:
+        Dictionary containing sample Yosys JSON structure.
+    """
+    return _session_yosys_json
+
+
+@pytest.fixture(scope="session")
+def sample_spice_content() -> str:
+    """Provide sample SPICE subcircuit content for testing.
+
+    Returns:
+        String containing sample SPICE subcircuit definitions.
+    """
+    return """* Sample SPICE subcircuit
+.SUBCKT INV A Y
+M1 Y A VDD VDD PMOS W=2u L=0.18u
+M2 Y A VSS VSS NMOS W=1u L=0.18u
+.ENDS INV
+
+.SUBCKT NAND2 A B Y
+M1 Y A VDD VDD PMOS W=2u L=0.18u
+M2 Y B VDD VDD PMOS W=2u L=0.18u
+M3 Y A net1 VSS NMOS W=1u L=0.18u
+M4 net1 B VSS VSS NMOS W=1u L=0.18u
+.ENDS NAND2
+
+.model NMOS NMOS (LEVEL=1 VTO=0.7)
+.model PMOS PMOS (LEVEL=1 VTO=-0.7)
+"""
+
+
+@pytest.fixture
+def temp_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    """Provide a temporary directory for test files.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+
+    Yields:
+        Path to temporary directory.
+    """
+    yield tmp_path
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_disk_caches(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[None, None, None]:
+    """Point the on-disk synthesis cache at a session temp directory.
+
+    Tests synthesize from throwaway tmp paths whose cache keys can never
+    be re-hit, so writing them under the user's real ~/.cache would leak
+    files on every run.
+
+    Args:
+        tmp_path_factory: Session-scoped pytest temp path factory.
+
+    Yields:
+        None while the cache directory is redirected.
+    """
+    from src.verilog2spice import synthesizer
+
+    original_dir = synthesizer._SYNTH_CACHE_DIR
+    synthesizer._SYNTH_CACHE_DIR = tmp_path_factory.mktemp("disk_cache")
+    yield
+    synthesizer._SYNTH_CACHE_DIR = original_dir
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _disable_progress() -> Generator[None, None, None]:
+    """Disable the rich progress display for the whole test session.
+
+    cli.main() checks V2S_NO_PROGRESS at call time and substitutes its
+    no-op progress, so tests need not patch Progress at all.
+
+    Yields:
+        None while the variable is set.
+    """
+    os.environ["V2S_NO_PROGRESS"] = "1"
+    yield
+    os.environ.pop("V2S_NO_PROGRESS", None)
+
+
+class _NullProgress:
+    """Minimal stand-in for rich.Progress with the methods cli.py calls.
+
+    Instantiating a plain class is an order of magnitude cheaper than a
+    MagicMock, which eagerly builds child mocks for every magic method.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Accept and ignore the column/console arguments."""
+
+    def __enter__(self) -> "_NullProgress":
+        """Enter the progress context."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Exit the progress context."""
+
+    def add_task(self, *args: Any, **kwargs: Any) -> int:
+        """Register a task; the ID is never inspected."""
+        return 0
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Ignore task updates."""
+
+
+@pytest.fixture(scope="session")
+def shared_spice_file(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """Write the minimal INV cell SPICE file once per session.
+
+    Args:
+        tmp_path_factory: Session-scoped pytest temp path factory.
+
+    Returns:
+        Path to the SPICE file.
+    """
+    spice_file = tmp_path_factory.mktemp("lib") / "cells.spice"
+    spice_file.write_text(".SUBCKT INV A Y\n.ENDS INV\n", encoding="utf-8")
+    return spice_file
+
+
+@pytest.fixture(scope="session")
+def spice_content_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Any:
+    """Materialize small canonical SPICE contents once per session.
+
+    Returns a callable mapping (tag, content) to a Path: each distinct
+    tag is written exactly once into a shared cache directory, so tests
+    that only read the file skip the per-test write syscalls.
+
+    Args:
+        tmp_path_factory: Session-scoped pytest temp path factory.
+
+    Returns:
+        Callable (tag, content) -> Path of the materialized file.
+    """
+    cache_dir = tmp_path_factory.mktemp("spice_cache")
+    materialized: Dict[str, Path] = {}
+
+    def _materialize(tag: str, content: str) -> Path:
+        spice_file = materialized.get(tag)
+        if spice_file is None:
+            spice_file = cache_dir / f"{tag}.spice"
+            spice_file.write_text(content, encoding="utf-8")
+            materialized[tag] = spice_file
+        return spice_file
+
+    return _materialize
+
+
+@pytest.fixture
+def prepared_output_tree(tmp_path: Path) -> Path:
+    """Provide an output directory pre-populated with stub netlists.
+
+    Covers the hierarchical, flat, and transistor file names the CLI
+    verification paths probe, written once as bytes.
+
+    Args:
+        tmp_path: Pytest temporary path fixture.
+
+    Returns:
+        Path to the prepared output directory.
+    """
+    output_dir = tmp_path / "output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "test_module.sp").write_bytes(b"* Hierarchical\n")
+    (output_dir / "test_module_flat.sp").write_bytes(b"* Flattened\n")
+    (output_dir / "test_module_transistor.sp").write_bytes(b"* Transistor level\n")
+    return output_dir
+
+
+@pytest.fixture(scope="session")
+def static_reference_file(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """Write the reference SPICE file once per session.
+
+    Args:
+        tmp_path_factory: Session-scoped pytest temp path factory.
+
+    Returns:
+        Path to the reference file.
+    """
+    reference_file = tmp_path_factory.mktemp("reference") / "reference.sp"
+    reference_file.write_bytes(b"* Reference\n")
+    return reference_file
+
+
+@pytest.fixture(scope="session")
+def sample_cell_library(
+    shared_spice_file: Path, _session_cell_library_data: Dict[str, Any]
+) -> Any:
+    """Build the shared CellLibrary once per session.
+
+    Tests only read from it, so one instance serves the whole run.
+
+    Args:
+        shared_spice_file: Session-scoped SPICE file.
+        _session_cell_library_data: Session-scoped cell library data.
+
+    Returns:
+        CellLibrary over the sample cells and SPICE file.
+    """
+    from src.verilog2spice.mapper import CellLibrary
+
+    return CellLibrary(
+        technology="generic",
+        cells=_session_cell_library_data["cells"],
+        spice_file=str(shared_spice_file),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_netlist(_session_yosys_json: Dict[str, Any]) -> Any:
+    """Build the shared gate-level Netlist once per session.
+
+    Args:
+        _session_yosys_json: Session-scoped sample Yosys JSON.
+
+    Returns:
+        Netlist with the standard test_module top.
+    """
+    from src.verilog2spice.synthesizer import Netlist
+
+    return Netlist(
+        modules={},
+        top_module="test_module",
+        json_data=_session_yosys_json,
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_module_info() -> Any:
+    """Build the shared ModuleInfo once per session.
+
+    Returns:
+        ModuleInfo for the standard test_module.
+    """
+    from src.verilog2spice.parser import ModuleInfo
+
+    return ModuleInfo(name="test_module", ports=[], cells=[])
+
+
+@pytest.fixture
+def cli_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Patch the CLI module's collaborators in one shot.
+
+    One monkeypatch.setattr per symbol replaces the per-test stacks of
+    @patch decorators and nested `with patch(...)` chains (and their
+    _patch.__enter__ overhead); everything reverts automatically. The
+    returned namespace exposes each mock under its cli attribute name,
+    with Progress pre-wired as a context manager.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        Namespace of the installed mocks.
+    """
+    from src.verilog2spice import cli as cli_module
+
+    mocks = SimpleNamespace()
+    for name in (
+        "synthesize",
+        "load_config",
+        "load_cell_library",
+        "setup_logging",
+        "parse_args",
+        "parse_yosys_json",
+        "get_top_module",
+        "generate_netlist",
+        "load_cell_library_content",
+        "format_hierarchical",
+        "format_flattened",
+        "validate_spice",
+        "check_netgen",
+        "verify_spice_vs_spice",
+        "compare_flattening_levels",
+    ):
+        mock = Mock(name=name)
+        monkeypatch.setattr(cli_module, name, mock)
+        setattr(mocks, name, mock)
+
+    for name in ("console", "logging"):
+        mock = MagicMock(name=name)
+        monkeypatch.setattr(cli_module, name, mock)
+        setattr(mocks, name, mock)
+
+    # main() drives Progress as a context manager; a real null object is
+    # far cheaper than a MagicMock per test
+    monkeypatch.setattr(cli_module, "Progress", _NullProgress)
+    mocks.Progress = _NullProgress
+
+    # main() unpacks compare_flattening_levels, so give it a real tuple
+    from src.verilog2spice.lvs import LVSResult
+
+    mocks.compare_flattening_levels.return_value = (
+        True,
+        LVSResult(matched=True, output="", errors=[], warnings=[]),
+    )
+    return mocks
+
+
+@pytest.fixture
+def fake_yosys(
+    monkeypatch: pytest.MonkeyPatch, _session_yosys_json: Dict[str, Any]
+) -> Generator[None, None, None]:
+    """Replace the Yosys runner with a fake that writes a canned netlist.
+
+    The fake parses the write_json target out of the command it receives,
+    drops the sample Yosys JSON there, and reports success - synthesize()
+    then runs end to end without spawning any process.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        _session_yosys_json: Session-scoped sample Yosys JSON.
+
+    Yields:
+        None while the fake runner is installed.
+    """
+    import re
+    import subprocess
+
+    from src.verilog2spice import synthesizer
+
+    def _fake_run(cmd: Any, **kwargs: Any) -> "subprocess.CompletedProcess[str]":
+        script = cmd[2] if len(cmd) > 2 else ""
+        if cmd[1] == "-s":
+            script = Path(script).read_text(encoding="utf-8")
+        match = re.search(r'write_json "?([^";\n]+)"?', script)
+        if match:
+            Path(match.group(1)).write_text(
+                json.dumps(_session_yosys_json), encoding="utf-8"
+            )
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(synthesizer, "check_yosys", lambda: True)
+    synthesizer.set_runner(_fake_run)
+    try:
+        yield
+    finally:
+        synthesizer.set_runner(None)
+
+
+@pytest.fixture(scope="session")
+def yosys_server() -> Generator[Any, None, None]:
+    """Share one long-lived Yosys process across the test session.
+
+    Yields:
+        Running YosysServer, or skips tests when Yosys is unavailable.
+    """
+    from src.verilog2spice.synthesizer import YosysServer, check_yosys
+
+    if not check_yosys():
+        pytest.skip("Yosys not installed")
+
+    with YosysServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def sample_cell_library_json_file(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Path, None, None]:
+    """Create a cell library JSON file once per test session.
+
+    Args:
+        tmp_path_factory: Session-scoped pytest temp path factory.
+
+    Yields:
+        Path to the JSON file.
+    """
+    json_file = tmp_path_factory.mktemp("cell_library") / "cells.json"
+    json_file.write_bytes(_CELL_LIBRARY_JSON_BYTES)
+    yield json_file
+
+
+@pytest.fixture(scope="session")
+def sample_spice_file(
+    tmp_path_factory: pytest.TempPathFactory, sample_spice_content: str
+) -> Generator[Path, None, None]:
+    """Create a SPICE file once per test session.
+
+    Args:
+        tmp_path_factory: Session-scoped pytest temp path factory.
+        sample_spice_content: Sample SPICE content.
+
+    Yields:
+        Path to the SPICE file.
+    """
+    spice_file = tmp_path_factory.mktemp("spice") / "cells.spice"
+    spice_file.write_text(sample_spice_content, encoding="utf-8")
+    yield spice_file